@@ -26,8 +26,21 @@ enabling PEP-compliant child hints to obtain this pith via this efficient
 variable rather than via this inefficient full Python expression.
 '''
 
+# ....................{ HINT ~ placeholder                 }....................
+# Each placeholder prefix and suffix defined below is a single non-printable
+# ASCII control character that is intentionally invalid as Python code and
+# never embedded in code generated by @beartype. Doing so guarantees that:
+# * The top-level call to the exec() builtin performed by the @beartype
+#   decorator raises a "SyntaxError" exception if a caller fails to replace any
+#   placeholder substring.
+# * These placeholders cannot ambiguously overlap with any other substring of
+#   generated code.
+# * These placeholders are efficiently resolvable by the C-based str.split()
+#   and str.partition() methods, which search for single characters with a
+#   single memchr() scan rather than a generic multi-character substring search.
+
 # ....................{ HINT ~ placeholder : child         }....................
-PEP_CODE_HINT_CHILD_PLACEHOLDER_PREFIX = '@['
+PEP_CODE_HINT_CHILD_PLACEHOLDER_PREFIX = '\x01'
 '''
 Prefix of each **placeholder hint child type-checking substring** (i.e.,
 placeholder to be globally replaced by a Python code snippet type-checking the
@@ -36,7 +49,7 @@ currently visited parent hint).
 '''
 
 
-PEP_CODE_HINT_CHILD_PLACEHOLDER_SUFFIX = ')!'
+PEP_CODE_HINT_CHILD_PLACEHOLDER_SUFFIX = '\x02'
 '''
 Suffix of each **placeholder hint child type-checking substring** (i.e.,
 placeholder to be globally replaced by a Python code snippet type-checking the
@@ -45,7 +58,7 @@ currently visited parent hint).
 '''
 
 # ....................{ HINT ~ placeholder : forwardref    }....................
-PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_PREFIX = '${FORWARDREF:'
+PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_PREFIX = '\x03'
 '''
 Prefix of each **placeholder unqualified forward reference classname
 substring** (i.e., placeholder to be globally replaced by a Python code snippet
@@ -55,7 +68,7 @@ caller-defined module declaring the currently decorated callable).
 '''
 
 
-PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_SUFFIX = ']?'
+PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_SUFFIX = '\x04'
 '''
 Suffix of each **placeholder unqualified forward reference classname
 substring** (i.e., placeholder to be globally replaced by a Python code snippet
@@ -67,20 +80,13 @@ caller-defined module declaring the currently decorated callable).
 # ....................{ HINT ~ pep : (484|585) : generic   }....................
 PEP484585_CODE_HINT_GENERIC_PREFIX = '''(
 {indent_curr}    # True only if this pith is of this generic type.
-{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and'''
+{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr})'''
 '''
 PEP-compliant code snippet prefixing all code type-checking the current pith
 against each unerased pseudo-superclass subclassed by a :pep:`484`-compliant
 **generic** (i.e., PEP-compliant type hint subclassing a combination of one or
 more of the :mod:`typing.Generic` superclass, the :mod:`typing.Protocol`
 superclass, and/or other :mod:`typing` non-class objects).
-
-Caveats
-----------
-The ``{indent_curr}`` format variable is intentionally brace-protected to
-efficiently defer its interpolation until the complete PEP-compliant code
-snippet type-checking the current pith against *all* subscripted arguments of
-this parent type has been generated.
 '''
 
 
@@ -94,24 +100,18 @@ generic.
 
 
 PEP484585_CODE_HINT_GENERIC_CHILD = '''
-{{indent_curr}}    # True only if this pith deeply satisfies this unerased
-{{indent_curr}}    # pseudo-superclass of this generic.
-{{indent_curr}}    {hint_child_placeholder} and'''
+{indent_curr}    # True only if this pith deeply satisfies this unerased
+{indent_curr}    # pseudo-superclass of this generic.
+{indent_curr}    {hint_child_placeholder}'''
 '''
 PEP-compliant code snippet type-checking the current pith against the current
 unerased pseudo-superclass subclassed by a :pep:`484`-compliant generic.
 
 Caveats
 ----------
-The caller is required to manually slice the trailing suffix ``" and"`` after
-applying this snippet to the last unerased pseudo-superclass of such a generic.
-While there exist alternate and more readable means of accomplishing this, this
-approach is the optimally efficient.
-
-The ``{indent_curr}`` format variable is intentionally brace-protected to
-efficiently defer its interpolation until the complete PEP-compliant code
-snippet type-checking the current pith against *all* subscripted arguments of
-this parent type has been generated.
+The caller is required to join the :data:`.PEP484585_CODE_HINT_GENERIC_PREFIX`
+snippet and all applications of this snippet to the unerased pseudo-superclasses
+of such a generic with the :data:`.CODE_OPERATOR_AND` delimiter.
 '''
 
 # ....................{ HINT ~ pep : (484|585) : sequence  }....................
@@ -168,7 +168,7 @@ of the current pith (which, by definition, *must* be a standard sequence).
 # ....................{ HINT ~ pep : (484|585) : tuple     }....................
 PEP484585_CODE_HINT_TUPLE_FIXED_PREFIX = '''(
 {indent_curr}    # True only if this pith is a tuple.
-{indent_curr}    isinstance({pith_curr_assign_expr}, tuple) and'''
+{indent_curr}    isinstance({pith_curr_assign_expr}, tuple)'''
 '''
 PEP-compliant code snippet prefixing all code type-checking the current pith
 against each subscripted child hint of an itemized :class:`typing.Tuple` type
@@ -186,8 +186,8 @@ of the form ``typing.Tuple[{typename1}, {typename2}, ..., {typenameN}]``.
 
 
 PEP484585_CODE_HINT_TUPLE_FIXED_EMPTY = '''
-{{indent_curr}}    # True only if this tuple is empty.
-{{indent_curr}}    not {pith_curr_var_name} and'''
+{indent_curr}    # True only if this tuple is empty.
+{indent_curr}    not {pith_curr_var_name}'''
 '''
 PEP-compliant code snippet prefixing all code type-checking the current pith
 to be empty against an itemized :class:`typing.Tuple` type of the non-standard
@@ -201,8 +201,8 @@ See Also
 
 
 PEP484585_CODE_HINT_TUPLE_FIXED_LEN = '''
-{{indent_curr}}    # True only if this tuple is of the expected length.
-{{indent_curr}}    len({pith_curr_var_name}) == {hint_childs_len} and'''
+{indent_curr}    # True only if this tuple is of the expected length.
+{indent_curr}    len({pith_curr_var_name}) == {hint_childs_len}'''
 '''
 PEP-compliant code snippet prefixing all code type-checking the current pith
 to be of the expected length against an itemized :class:`typing.Tuple` type of
@@ -216,9 +216,9 @@ See Also
 
 
 PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_CHILD = '''
-{{indent_curr}}    # True only if this item of this non-empty tuple deeply
-{{indent_curr}}    # satisfies this child hint.
-{{indent_curr}}    {hint_child_placeholder} and'''
+{indent_curr}    # True only if this item of this non-empty tuple deeply
+{indent_curr}    # satisfies this child hint.
+{indent_curr}    {hint_child_placeholder}'''
 '''
 PEP-compliant code snippet type-checking the current pith against the current
 child hint subscripting an itemized :class:`typing.Tuple` type of the form
@@ -226,15 +226,11 @@ child hint subscripting an itemized :class:`typing.Tuple` type of the form
 
 Caveats
 ----------
-The caller is required to manually slice the trailing suffix ``" and"`` after
-applying this snippet to the last subscripted child hint of an itemized
-:class:`typing.Tuple` type. While there exist alternate and more readable means
-of accomplishing this, this approach is the optimally efficient.
-
-The ``{indent_curr}`` format variable is intentionally brace-protected to
-efficiently defer its interpolation until the complete PEP-compliant code
-snippet type-checking the current pith against *all* subscripted arguments of
-this parent type has been generated.
+The caller is required to join the
+:data:`.PEP484585_CODE_HINT_TUPLE_FIXED_PREFIX` snippet, the
+:data:`.PEP484585_CODE_HINT_TUPLE_FIXED_LEN` snippet, and all applications of
+this snippet to the subscripted child hints of an itemized
+:class:`typing.Tuple` type with the :data:`.CODE_OPERATOR_AND` delimiter.
 '''
 
 
@@ -284,7 +280,7 @@ against each subscripted argument of a :class:`typing.Union` type hint.
 
 
 PEP484_CODE_HINT_UNION_CHILD_PEP = '''
-{{indent_curr}}    {hint_child_placeholder} or'''
+{indent_curr}    {hint_child_placeholder}'''
 '''
 PEP-compliant code snippet type-checking the current pith against the current
 PEP-compliant child argument subscripting a parent :class:`typing.Union` type
@@ -292,21 +288,15 @@ hint.
 
 Caveats
 ----------
-The caller is required to manually slice the trailing suffix ``" or"`` after
-applying this snippet to the last subscripted argument of such a hint. While
-there exist alternate and more readable means of accomplishing this, this
-approach is the optimally efficient.
-
-The ``{indent_curr}`` format variable is intentionally brace-protected to
-efficiently defer its interpolation until the complete PEP-compliant code
-snippet type-checking the current pith against *all* subscripted arguments of
-this parent hint has been generated.
+The caller is required to join all applications of this snippet to the
+subscripted arguments of such a hint with the :data:`.CODE_OPERATOR_OR`
+delimiter.
 '''
 
 
 PEP484_CODE_HINT_UNION_CHILD_NONPEP = '''
-{{indent_curr}}    # True only if this pith is of one of these types.
-{{indent_curr}}    isinstance({pith_curr_expr}, {hint_curr_expr}) or'''
+{indent_curr}    # True only if this pith is of one of these types.
+{indent_curr}    isinstance({pith_curr_expr}, {hint_curr_expr})'''
 '''
 PEP-compliant code snippet type-checking the current pith against the current
 PEP-noncompliant child argument subscripting a parent :class:`typing.Union`
@@ -319,13 +309,62 @@ See Also
 '''
 
 # ....................{ HINT ~ pep : 586                   }....................
+PEP586_CODE_HINT_HASHABLE_PREFIX = '''(
+{indent_curr}    # True only if this pith is of one of these literal types.
+{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_child_types_expr}) and (
+{indent_curr}        # If this pith is exactly of one of these types, true
+{indent_curr}        # only if this pith is in the set of these literals.
+{indent_curr}        {pith_curr_var_name} in {hint_childs_expr}
+{indent_curr}        if type({pith_curr_var_name}) in (
+{indent_curr}            {hint_child_types_tuple_expr}) else
+{indent_curr}        # Else, this pith is an instance of a possibly
+{indent_curr}        # unhashable subclass of one of these types. True only
+{indent_curr}        # if this pith is equal to one of these literals.
+{indent_curr}        ('''
+'''
+PEP-compliant code snippet prefixing all code type-checking the current pith
+against a :pep:`586`-compliant :class:`typing.Literal` type hint subscripted by
+one or more literal objects that are all hashable.
+
+This snippet tests membership of this pith in a frozen set of these literal
+objects, reducing the ``O(n)`` disjunction of equality comparisons generated by
+the :data:`.PEP586_CODE_HINT_LITERAL` snippet to a single ``O(1)`` hash lookup.
+Since frozen set membership compares items by hash *and* equality, this test is
+semantically equivalent to that disjunction for all piths whose types are
+exactly the types of these literal objects and thus hashable.
+
+Piths that are instances of subclasses of these types are *not* necessarily
+hashable (e.g., :class:`int` subclasses overriding ``__eq__()`` but *not*
+``__hash__()``) and may compare equal to these literal objects under a
+different hash. This snippet thus guards this membership test by an exact type
+test, falling back to that disjunction for such piths.
+
+Caveats
+----------
+The caller is required to (in order):
+
+#. Append all applications of the :data:`.PEP586_CODE_HINT_LITERAL` snippet to
+   these literal objects joined with the :data:`.CODE_OPERATOR_OR` delimiter.
+#. Append the :data:`.PEP586_CODE_HINT_HASHABLE_SUFFIX` snippet.
+'''
+
+
+PEP586_CODE_HINT_HASHABLE_SUFFIX = '''
+{indent_curr}        )))'''
+'''
+PEP-compliant code snippet suffixing all code type-checking the current pith
+against a :pep:`586`-compliant :class:`typing.Literal` type hint subscripted by
+one or more literal objects that are all hashable.
+'''
+
+
 PEP586_CODE_HINT_PREFIX = '''(
-{{indent_curr}}    # True only if this pith is of one of these literal types.
-{{indent_curr}}    isinstance({pith_curr_assign_expr}, {hint_child_types_expr}) and ('''
+{indent_curr}    # True only if this pith is of one of these literal types.
+{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_child_types_expr}) and ('''
 '''
 PEP-compliant code snippet prefixing all code type-checking the current pith
 against a :pep:`586`-compliant :class:`typing.Literal` type hint subscripted by
-one or more literal objects.
+one or more literal objects, one or more of which are unhashable.
 '''
 
 
@@ -339,8 +378,8 @@ one or more literal objects.
 
 
 PEP586_CODE_HINT_LITERAL = '''
-{{indent_curr}}        # True only if this pith is equal to this literal.
-{{indent_curr}}        {pith_curr_var_name} == {hint_child_expr} or'''
+{indent_curr}        # True only if this pith is equal to this literal.
+{indent_curr}        {pith_curr_var_name} == {hint_child_expr}'''
 '''
 PEP-compliant code snippet type-checking the current pith against the current
 child literal object subscripting a :pep:`586`-compliant
@@ -348,20 +387,14 @@ child literal object subscripting a :pep:`586`-compliant
 
 Caveats
 ----------
-The caller is required to manually slice the trailing suffix ``" and"`` after
-applying this snippet to the last subscripted argument of such a
-:class:`typing.Literal` type. While there exist alternate and more readable
-means of accomplishing this, this approach is the optimally efficient.
-
-The ``{indent_curr}`` format variable is intentionally brace-protected to
-efficiently defer its interpolation until the complete PEP-compliant code
-snippet type-checking the current pith against *all* subscripted arguments of
-this parent hint has been generated.
+The caller is required to join all applications of this snippet to the
+literal objects subscripting such a :class:`typing.Literal` type with the
+:data:`.CODE_OPERATOR_OR` delimiter.
 '''
 
 # ....................{ HINT ~ pep : 593                   }....................
 PEP593_CODE_HINT_VALIDATOR_PREFIX = '''(
-{indent_curr}    {hint_child_placeholder} and'''
+{indent_curr}    {hint_child_placeholder}'''
 '''
 PEP-compliant code snippet prefixing all code type-checking the current pith
 against a :pep:`593`-compliant :class:`typing.Annotated` type hint subscripted
@@ -381,7 +414,7 @@ subscripted by one or more :class:`beartype.vale.BeartypeValidator` objects.
 PEP593_CODE_HINT_VALIDATOR_CHILD = '''
 {indent_curr}    # True only if this pith satisfies this caller-defined
 {indent_curr}    # validator of this annotated.
-{indent_curr}    {hint_child_expr} and'''
+{indent_curr}    {hint_child_expr}'''
 '''
 PEP-compliant code snippet type-checking the current pith against
 :mod:`beartype`-specific **data validator code** (i.e., caller-defined
@@ -391,8 +424,8 @@ child :class:`beartype.vale.BeartypeValidator` argument subscripting a parent `P
 
 Caveats
 ----------
-The caller is required to manually slice the trailing suffix ``" and"`` after
-applying this snippet to the last subscripted argument of such a
-:class:`typing.Annotated` type. While there exist alternate and more readable
-means of accomplishing this, this approach is the optimally efficient.
+The caller is required to join the :data:`.PEP593_CODE_HINT_VALIDATOR_PREFIX`
+snippet and all applications of this snippet to the subscripted arguments of
+such a :class:`typing.Annotated` type with the :data:`.CODE_OPERATOR_AND`
+delimiter.
 '''
@@ -78,52 +78,6 @@ there exists demonstrable performance costs.
 '''
 
 
-HINT_META_INDEX_PLACEHOLDER = next(__hint_meta_index_counter)
-'''
-0-based index into each tuple of hint metadata providing the **current
-placeholder type-checking substring** (i.e., placeholder to be globally
-replaced by a Python code snippet type-checking the current pith expression
-against the hint described by this metadata on visiting that hint).
-
-This substring provides indirection enabling the currently visited parent hint
-to defer and delegate the generation of code type-checking each child argument
-of that hint to the later time at which that child argument is visited.
-
-Example
-----------
-For example, the
-:func:`beartype._decor._hint._pep._pephint.make_func_wrapper_code` function might
-generate intermediary code resembling the following on visiting the
-:data:`Union` parent of a ``Union[int, str]`` object *before* visiting either
-the :class:`int` or :class:`str` children of that object:
-
-    if not (
-        @{0}! or
-        @{1}!
-    ):
-        raise get_beartype_violation(
-            func=__beartype_func,
-            pith_name=$%PITH_ROOT_NAME/~,
-            pith_value=__beartype_pith_root,
-        )
-
-Note the unique substrings ``"@{0}!"`` and ``"@{1}!"`` in that code, which that
-function iteratively replaces with code type-checking each of the child
-arguments of that :data:`Union` parent (i.e., :class:`int`, :class:`str`). The
-final code memoized by that function might then resemble:
-
-    if not (
-        isinstance(__beartype_pith_root, int) or
-        isinstance(__beartype_pith_root, str)
-    ):
-        raise get_beartype_violation(
-            func=__beartype_func,
-            pith_name=$%PITH_ROOT_NAME/~,
-            pith_value=__beartype_pith_root,
-        )
-'''
-
-
 HINT_META_INDEX_PITH_EXPR = next(__hint_meta_index_counter)
 '''
 0-based index into each tuple of hint metadata providing the **current
@@ -21,7 +21,10 @@ from beartype.roar import (
     BeartypeDecorHintPepUnsupportedException,
     BeartypeDecorHintPep593Exception,
 )
-from beartype.typing import Optional
+from beartype.typing import (
+    List,
+    Optional,
+)
 from beartype._cave._cavefast import TestableTypes
 from beartype._check.checkmagic import (
     ARG_NAME_CLS_STACK,
@@ -33,7 +36,6 @@ from beartype._check.code.codemagic import (
     EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL,
     EXCEPTION_PREFIX_HINT,
     HINT_META_INDEX_HINT,
-    HINT_META_INDEX_PLACEHOLDER,
     HINT_META_INDEX_PITH_EXPR,
     HINT_META_INDEX_PITH_VAR_NAME,
     HINT_META_INDEX_INDENT,
@@ -65,6 +67,8 @@ from beartype._check.code._codesnip import (
     PEP484_CODE_HINT_UNION_CHILD_NONPEP,
     PEP484_CODE_HINT_UNION_PREFIX,
     PEP484_CODE_HINT_UNION_SUFFIX,
+    PEP586_CODE_HINT_HASHABLE_PREFIX,
+    PEP586_CODE_HINT_HASHABLE_SUFFIX,
     PEP586_CODE_HINT_LITERAL,
     PEP586_CODE_HINT_PREFIX,
     PEP586_CODE_HINT_SUFFIX,
@@ -100,8 +104,6 @@ from beartype._data.hint.pep.sign.datapepsigns import (
 )
 from beartype._data.hint.pep.sign.datapepsignset import (
     HINT_SIGNS_SEQUENCE_ARGS_1,
-    HINT_SIGNS_SUPPORTED_DEEP,
-    HINT_SIGNS_ORIGIN_ISINSTANCEABLE,
     HINT_SIGNS_UNION,
 )
 from beartype._util.func.utilfuncscope import add_func_scope_attr
@@ -132,19 +134,19 @@ from beartype._util.hint.pep.utilpepget import (
 from beartype._util.hint.pep.utilpeptest import (
     die_if_hint_pep_unsupported,
     is_hint_pep,
-    is_hint_pep_args,
+    is_hint_pep_shallow,
     warn_if_hint_pep_deprecated,
 )
 from beartype._check.convert.convsanify import sanify_hint_any
 from beartype._util.hint.utilhinttest import is_hint_ignorable
 from beartype._util.kind.utilkinddict import update_mapping
+from beartype._util.text.utiltextformat import FormatPlan
 from beartype._util.text.utiltextmagic import (
     CODE_INDENT_1,
     CODE_INDENT_2,
-    LINE_RSTRIP_INDEX_AND,
-    LINE_RSTRIP_INDEX_OR,
+    CODE_OPERATOR_AND,
+    CODE_OPERATOR_OR,
 )
-from beartype._util.text.utiltextmunge import replace_str_substrs
 from beartype._util.text.utiltextrepr import represent_object
 from collections.abc import Callable
 from random import getrandbits
@@ -173,55 +175,77 @@ def make_check_expr(
     # "beartype._check.checkmagic" globals.
     _CODE_INDENT_1=CODE_INDENT_1,
     _CODE_INDENT_2=CODE_INDENT_2,
+    _CODE_OPERATOR_AND=CODE_OPERATOR_AND,
+    _CODE_OPERATOR_OR=CODE_OPERATOR_OR,
     _EXCEPTION_PREFIX=EXCEPTION_PLACEHOLDER,
     _EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL=EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL,
     _EXCEPTION_PREFIX_HINT=EXCEPTION_PREFIX_HINT,
 
     # "beartype._check.code.codemagic" globals.
     _HINT_META_INDEX_HINT=HINT_META_INDEX_HINT,
-    _HINT_META_INDEX_PLACEHOLDER=HINT_META_INDEX_PLACEHOLDER,
     _HINT_META_INDEX_PITH_EXPR=HINT_META_INDEX_PITH_EXPR,
     _HINT_META_INDEX_PITH_VAR_NAME=HINT_META_INDEX_PITH_VAR_NAME,
     _HINT_META_INDEX_INDENT=HINT_META_INDEX_INDENT,
-    _LINE_RSTRIP_INDEX_AND=LINE_RSTRIP_INDEX_AND,
-    _LINE_RSTRIP_INDEX_OR=LINE_RSTRIP_INDEX_OR,
+
+    # "beartype._check.code._codesnip" string globals.
+    _PEP_CODE_HINT_CHILD_PLACEHOLDER_PREFIX=(
+        PEP_CODE_HINT_CHILD_PLACEHOLDER_PREFIX),
+    _PEP_CODE_HINT_CHILD_PLACEHOLDER_SUFFIX=(
+        PEP_CODE_HINT_CHILD_PLACEHOLDER_SUFFIX),
 
     # "beartype._check.code._codesnip" string globals required only for
-    # their bound str.format() methods.
+    # the bound FormatPlan.format() methods of format plans precompiled from
+    # these globals at import time.
     PEP_CODE_PITH_ASSIGN_EXPR_format: Callable = (
-        PEP_CODE_PITH_ASSIGN_EXPR.format),
+        FormatPlan(PEP_CODE_PITH_ASSIGN_EXPR).format),
     PEP484_CODE_HINT_INSTANCE_format: Callable = (
-        PEP484_CODE_HINT_INSTANCE.format),
+        FormatPlan(PEP484_CODE_HINT_INSTANCE).format),
     PEP484585_CODE_HINT_GENERIC_CHILD_format: Callable = (
-        PEP484585_CODE_HINT_GENERIC_CHILD.format),
+        FormatPlan(PEP484585_CODE_HINT_GENERIC_CHILD).format),
+    PEP484585_CODE_HINT_GENERIC_PREFIX_format: Callable = (
+        FormatPlan(PEP484585_CODE_HINT_GENERIC_PREFIX).format),
+    PEP484585_CODE_HINT_GENERIC_SUFFIX_format: Callable = (
+        FormatPlan(PEP484585_CODE_HINT_GENERIC_SUFFIX).format),
     PEP484585_CODE_HINT_SEQUENCE_ARGS_1_format: Callable = (
-        PEP484585_CODE_HINT_SEQUENCE_ARGS_1.format),
+        FormatPlan(PEP484585_CODE_HINT_SEQUENCE_ARGS_1).format),
     PEP484585_CODE_HINT_SEQUENCE_ARGS_1_PITH_CHILD_EXPR_format: Callable = (
-        PEP484585_CODE_HINT_SEQUENCE_ARGS_1_PITH_CHILD_EXPR.format),
+        FormatPlan(PEP484585_CODE_HINT_SEQUENCE_ARGS_1_PITH_CHILD_EXPR).format),
     PEP484585_CODE_HINT_SUBCLASS_format: Callable = (
-        PEP484585_CODE_HINT_SUBCLASS.format),
+        FormatPlan(PEP484585_CODE_HINT_SUBCLASS).format),
     PEP484585_CODE_HINT_TUPLE_FIXED_EMPTY_format: Callable = (
-        PEP484585_CODE_HINT_TUPLE_FIXED_EMPTY.format),
+        FormatPlan(PEP484585_CODE_HINT_TUPLE_FIXED_EMPTY).format),
     PEP484585_CODE_HINT_TUPLE_FIXED_LEN_format: Callable = (
-        PEP484585_CODE_HINT_TUPLE_FIXED_LEN.format),
+        FormatPlan(PEP484585_CODE_HINT_TUPLE_FIXED_LEN).format),
     PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_CHILD_format: Callable = (
-        PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_CHILD.format),
+        FormatPlan(PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_CHILD).format),
     PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR_format: Callable = (
-        PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR.format),
+        FormatPlan(PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR).format),
+    PEP484585_CODE_HINT_TUPLE_FIXED_PREFIX_format: Callable = (
+        FormatPlan(PEP484585_CODE_HINT_TUPLE_FIXED_PREFIX).format),
+    PEP484585_CODE_HINT_TUPLE_FIXED_SUFFIX_format: Callable = (
+        FormatPlan(PEP484585_CODE_HINT_TUPLE_FIXED_SUFFIX).format),
     PEP484_CODE_HINT_UNION_CHILD_PEP_format: Callable = (
-        PEP484_CODE_HINT_UNION_CHILD_PEP.format),
+        FormatPlan(PEP484_CODE_HINT_UNION_CHILD_PEP).format),
     PEP484_CODE_HINT_UNION_CHILD_NONPEP_format: Callable = (
-        PEP484_CODE_HINT_UNION_CHILD_NONPEP.format),
+        FormatPlan(PEP484_CODE_HINT_UNION_CHILD_NONPEP).format),
+    PEP484_CODE_HINT_UNION_SUFFIX_format: Callable = (
+        FormatPlan(PEP484_CODE_HINT_UNION_SUFFIX).format),
+    PEP586_CODE_HINT_HASHABLE_PREFIX_format: Callable = (
+        FormatPlan(PEP586_CODE_HINT_HASHABLE_PREFIX).format),
+    PEP586_CODE_HINT_HASHABLE_SUFFIX_format: Callable = (
+        FormatPlan(PEP586_CODE_HINT_HASHABLE_SUFFIX).format),
     PEP586_CODE_HINT_LITERAL_format: Callable = (
-        PEP586_CODE_HINT_LITERAL.format),
+        FormatPlan(PEP586_CODE_HINT_LITERAL).format),
     PEP586_CODE_HINT_PREFIX_format: Callable = (
-        PEP586_CODE_HINT_PREFIX.format),
+        FormatPlan(PEP586_CODE_HINT_PREFIX).format),
+    PEP586_CODE_HINT_SUFFIX_format: Callable = (
+        FormatPlan(PEP586_CODE_HINT_SUFFIX).format),
     PEP593_CODE_HINT_VALIDATOR_PREFIX_format: Callable = (
-        PEP593_CODE_HINT_VALIDATOR_PREFIX.format),
+        FormatPlan(PEP593_CODE_HINT_VALIDATOR_PREFIX).format),
     PEP593_CODE_HINT_VALIDATOR_SUFFIX_format: Callable = (
-        PEP593_CODE_HINT_VALIDATOR_SUFFIX.format),
+        FormatPlan(PEP593_CODE_HINT_VALIDATOR_SUFFIX).format),
     PEP593_CODE_HINT_VALIDATOR_CHILD_format: Callable = (
-        PEP593_CODE_HINT_VALIDATOR_CHILD.format),
+        FormatPlan(PEP593_CODE_HINT_VALIDATOR_CHILD).format),
 ) -> CodeGenerated:
     '''
     **Type-checking expression factory** (i.e., low-level callable dynamically
@@ -328,13 +352,6 @@ def make_check_expr(
     # type) associated with the currently visited type hint if any.
     hint_curr_expr = None
 
-    # Placeholder string to be globally replaced in the Python code snippet to
-    # be returned (i.e., "func_wrapper_code") by a Python code snippet
-    # type-checking the current pith expression (i.e.,
-    # "pith_curr_var_name") against the currently visited hint (i.e.,
-    # "hint_curr").
-    hint_curr_placeholder = None
-
     # Full Python expression evaluating to the value of the current pith (i.e.,
     # possibly nested object of the passed parameter or return value to be
     # type-checked against the currently visited hint).
@@ -515,6 +532,12 @@ def make_check_expr(
     # visited hint (to be appended to the "func_wrapper_code" string).
     func_curr_code: str = None  # type: ignore[assignment]
 
+    # List of all Python code snippets (e.g., prefix, child hints) collectively
+    # type-checking the current pith against the currently visited hint, joined
+    # into the "func_curr_code" string *AFTER* generating all such snippets
+    # rather than repeatedly concatenated onto that string while doing so.
+    func_curr_code_substrs: List[str] = None  # type: ignore[assignment]
+
     # ..................{ FUNC ~ code : locals               }..................
     # Local scope (i.e., dictionary mapping from the name to value of each
     # attribute referenced in the signature) of this wrapper function required
@@ -570,21 +593,19 @@ def make_check_expr(
         # this list, by prior validation.
         hints_meta_index_last += 1
 
-        # Placeholder string to be globally replaced by code type-checking the
-        # child pith against this child hint, intentionally prefixed and
-        # suffixed by characters that:
+        # Placeholder string to be subsequently replaced by code type-checking
+        # the child pith against this child hint, embedding the 0-based index
+        # of the metadata describing this child hint in the "hints_meta" list
+        # between a prefix and suffix that:
         #
         # * Are intentionally invalid as Python code, guaranteeing that the
         #   top-level call to the exec() builtin performed by the @beartype
         #   decorator will raise a "SyntaxError" exception if the caller fails
         #   to replace all placeholder substrings generated by this method.
-        # * Protect the identifier embedded in this substring against ambiguous
-        #   global replacements of larger identifiers containing this
-        #   identifier. If this identifier were *NOT* protected in this manner,
-        #   then the first substring "0" generated by this method would
-        #   ambiguously overlap with the subsequent substring "10" generated by
-        #   this method, which would then produce catastrophically erroneous
-        #   and non-trivial to debug Python code.
+        # * Delimit this index, enabling the resolution performed after the
+        #   breadth-first search below to split the code type-checking the
+        #   parent hint on this prefix and partition each resulting substring
+        #   on this suffix into this index and the remainder of that substring.
         hint_child_placeholder = (
             f'{PEP_CODE_HINT_CHILD_PLACEHOLDER_PREFIX}'
             f'{str(hints_meta_index_last)}'
@@ -599,7 +620,6 @@ def make_check_expr(
         # "hints_meta_index_last".
         hints_meta[hints_meta_index_last] = (
             hint_child,
-            hint_child_placeholder,
             pith_child_expr,
             pith_curr_var_name,
             indent_child,
@@ -612,22 +632,15 @@ def make_check_expr(
     # Local variables calling one or more closures declared above and thus
     # deferred until after declaring those closures.
 
-    # Placeholder string to be globally replaced in the Python code snippet to
-    # be returned (i.e., "func_wrapper_code") by a Python code snippet
-    # type-checking the child pith expression (i.e., "pith_child_expr") against
-    # the currently iterated child hint (i.e., "hint_child"), initialized to a
-    # placeholder describing the root hint.
-    hint_child_placeholder = _enqueue_hint_child(VAR_NAME_PITH_ROOT)
-
-    # Python code snippet type-checking the root pith against the root hint,
-    # localized separately from the "func_wrapper_code" snippet to enable this
-    # function to validate this code to be valid *BEFORE* returning this code.
-    func_root_code = hint_child_placeholder
+    # Enqueue metadata describing the root hint at index 0 of the "hints_meta"
+    # list. Since the code type-checking the root pith against the root hint
+    # is subsequently resolved directly from that index, the placeholder
+    # string returned by this closure is safely ignorable here.
+    _enqueue_hint_child(VAR_NAME_PITH_ROOT)
 
-    # Python code snippet to be returned, seeded with a placeholder to be
-    # replaced on the first iteration of the breadth-first search performed
-    # below with a snippet type-checking the root pith against the root hint.
-    func_wrapper_code = func_root_code
+    # Python code snippet to be returned, resolved *AFTER* the breadth-first
+    # search performed below from the code generated for each visited hint.
+    func_wrapper_code: str = None  # type: ignore[assignment]
 
     # ..................{ SEARCH                             }..................
     # While the 0-based index of metadata describing the next visited hint in
@@ -649,7 +662,6 @@ def make_check_expr(
         #FIXME: [SPEED] Optimize by reducing to a single tuple unpacking.
         # Localize metadatum for both efficiency and f-string purposes.
         hint_curr             = hint_curr_meta[_HINT_META_INDEX_HINT]
-        hint_curr_placeholder = hint_curr_meta[_HINT_META_INDEX_PLACEHOLDER]
         pith_curr_expr        = hint_curr_meta[_HINT_META_INDEX_PITH_EXPR]
         pith_curr_var_name    = hint_curr_meta[_HINT_META_INDEX_PITH_VAR_NAME]
         indent_curr           = hint_curr_meta[_HINT_META_INDEX_INDENT]
@@ -671,13 +683,6 @@ def make_check_expr(
             )
         # Else, this is the already sanified root hint.
 
-        #FIXME: Comment this sanity check out after we're sufficiently
-        #convinced this algorithm behaves as expected. While useful, this check
-        #requires a linear search over the entire code and is thus costly.
-        # assert hint_curr_placeholder in func_wrapper_code, (
-        #     '{} {!r} placeholder {} not found in wrapper body:\n{}'.format(
-        #         hint_curr_exception_prefix, hint, hint_curr_placeholder, func_wrapper_code))
-
         # ................{ PEP                                }................
         # If this hint is PEP-compliant...
         if is_hint_pep(hint_curr):
@@ -794,19 +799,9 @@ def make_check_expr(
             # whose requirements are more understandably minimalist.
             #
             # ..............{ ORIGIN                             }..............
-            # If this hint both...
-            if (
-                # Originates from an origin type and may thus be shallowly
-                # type-checked against that type *AND is either...
-                hint_curr_sign in HINT_SIGNS_ORIGIN_ISINSTANCEABLE and (
-                    # Unsubscripted *OR*...
-                    not is_hint_pep_args(hint_curr) or
-                    #FIXME: Remove this branch *AFTER* deeply supporting all
-                    #hints.
-                    # Currently unsupported with deep type-checking...
-                    hint_curr_sign not in HINT_SIGNS_SUPPORTED_DEEP
-                )
-            ):
+            # If this hint originates from an origin type *AND* is either
+            # unsubscripted or currently unsupported with deep type-checking...
+            if is_hint_pep_shallow(hint_curr, hint_curr_sign):
             # Then generate trivial code shallowly type-checking the current
             # pith as an instance of the origin type originating this sign
             # (e.g., "list" for the hint "typing.List[int]").
@@ -1258,8 +1253,41 @@ def make_check_expr(
 
                         # If this child hint is PEP-compliant...
                         if is_hint_pep(hint_child):
-                            # Filter this child hint into the set of
-                            # PEP-compliant child hints.
+                            # Sign uniquely identifying this child hint.
+                            hint_child_sign = get_hint_pep_sign(hint_child)
+
+                            # If this child hint both originates from an origin
+                            # type *AND* is either unsubscripted or currently
+                            # unsupported with deep type-checking, this child
+                            # hint is only shallowly type-checked against that
+                            # type (e.g., "list" for "typing.List"). In this
+                            # case, filter that type into the set of
+                            # PEP-noncompliant child hints. Doing so type-checks
+                            # this child hint by the same single isinstance()
+                            # call type-checking all other such types rather
+                            # than by an additional isinstance() call.
+                            if is_hint_pep_shallow(
+                                hint_child, hint_child_sign):
+                                # Preserve the validation and deprecation
+                                # warnings otherwise performed on visiting this
+                                # child hint.
+                                die_if_hint_pep_unsupported(
+                                    hint=hint_child,
+                                    exception_prefix=_EXCEPTION_PREFIX,
+                                )
+                                warn_if_hint_pep_deprecated(
+                                    hint=hint_child,
+                                    warning_prefix=_EXCEPTION_PREFIX,
+                                )
+
+                                # Filter this origin type into the set of
+                                # PEP-noncompliant child hints.
+                                hint_childs_nonpep.add(
+                                    get_hint_pep_origin_type_isinstanceable(
+                                        hint_child))
+                            # Else, this child hint is deeply type-checked.
+                            # In this case, filter this child hint into the set
+                            # of PEP-compliant child hints.
                             #
                             # Note that this PEP-compliant child hint *CANNOT*
                             # also be filtered into the set of PEP-noncompliant
@@ -1269,7 +1297,8 @@ def make_check_expr(
                             # false positives when the current pith shallowly
                             # satisfies this non-"typing" type but does *NOT*
                             # deeply satisfy this child hint.
-                            hint_childs_pep.add(hint_child)
+                            else:
+                                hint_childs_pep.add(hint_child)
                         # Else, this child hint is PEP-noncompliant. In this
                         # case, filter this child hint into the list of
                         # PEP-noncompliant arguments.
@@ -1277,8 +1306,8 @@ def make_check_expr(
                             hint_childs_nonpep.add(hint_child)
 
                     # Initialize the code type-checking the current pith against
-                    # these arguments to the substring prefixing all such code.
-                    func_curr_code = PEP484_CODE_HINT_UNION_PREFIX
+                    # these arguments to the empty list.
+                    func_curr_code_substrs = []
 
                     # If this union is subscripted by one or more
                     # PEP-noncompliant child hints, generate and append
@@ -1286,8 +1315,9 @@ def make_check_expr(
                     # less efficient code type-checking any PEP-compliant child
                     # hints subscripting this union.
                     if hint_childs_nonpep:
-                        func_curr_code += (
+                        func_curr_code_substrs.append(
                             PEP484_CODE_HINT_UNION_CHILD_NONPEP_format(
+                                indent_curr=indent_curr,
                                 # Python expression yielding the value of the
                                 # current pith. Specifically...
                                 pith_curr_expr=(
@@ -1342,8 +1372,9 @@ def make_check_expr(
                     # and append code type-checking this child hint.
                     for hint_child_index, hint_child in enumerate(
                         hint_childs_pep):
-                        func_curr_code += (
+                        func_curr_code_substrs.append(
                             PEP484_CODE_HINT_UNION_CHILD_PEP_format(
+                                indent_curr=indent_curr,
                                 # Python expression yielding the value of the
                                 # current pith.
                                 hint_child_placeholder=_enqueue_hint_child(
@@ -1382,25 +1413,28 @@ def make_check_expr(
                                     pith_curr_assign_expr
                                 )))
 
-                    # If this code is *NOT* its initial value, this union is
-                    # subscripted by one or more unignorable child hints and
-                    # the above logic generated code type-checking these child
-                    # hints. In this case...
-                    if func_curr_code is not (
-                        PEP484_CODE_HINT_UNION_PREFIX):
+                    # If this list is non-empty, this union is subscripted by
+                    # one or more unignorable child hints and the above logic
+                    # generated code type-checking these child hints. In this
+                    # case...
+                    if func_curr_code_substrs:
                         # Munge this code to...
                         func_curr_code = (
-                            # Strip the erroneous " or" suffix appended by the
-                            # last child hint from this code.
-                            f'{func_curr_code[:_LINE_RSTRIP_INDEX_OR]}'
+                            # Prefix this code by the substring prefixing all
+                            # such code.
+                            f'{PEP484_CODE_HINT_UNION_PREFIX}'
+                            # Disjunctively join the code type-checking these
+                            # child hints.
+                            f'{_CODE_OPERATOR_OR.join(func_curr_code_substrs)}'
                             # Suffix this code by the substring suffixing all
                             # such code.
-                            f'{PEP484_CODE_HINT_UNION_SUFFIX}'
-                        # Format the "indent_curr" prefix into this code
-                            # deferred above for efficiency.
-                        ).format(indent_curr=indent_curr)
-                    # Else, this snippet is its initial value and thus
-                    # ignorable.
+                            f'{PEP484_CODE_HINT_UNION_SUFFIX_format(indent_curr=indent_curr)}'
+                        )
+                    # Else, this list is empty and this union thus ignorable.
+                    # In this case, preserve the code type-checking this union
+                    # as the substring prefixing all such code.
+                    else:
+                        func_curr_code = PEP484_CODE_HINT_UNION_PREFIX
 
                     # Release this pair of sets back to their respective pools.
                     release_object_typed(hint_childs_nonpep)
@@ -1540,14 +1574,22 @@ def make_check_expr(
 
                     # Initialize the code type-checking this pith against this
                     # tuple to the substring prefixing all such code.
-                    func_curr_code = PEP484585_CODE_HINT_TUPLE_FIXED_PREFIX
+                    func_curr_code = (
+                        PEP484585_CODE_HINT_TUPLE_FIXED_PREFIX_format(
+                            indent_curr=indent_curr,
+                            pith_curr_assign_expr=pith_curr_assign_expr,
+                        ))
+
+                    # Initialize the list of code snippets to this prefix.
+                    func_curr_code_substrs = [func_curr_code]
 
                     # If this hint is the empty fixed-length tuple, generate
                     # and append code type-checking the current pith to be the
                     # empty tuple. This edge case constitutes a code smell.
                     if is_hint_pep484585_tuple_empty(hint_curr):
-                        func_curr_code += (
+                        func_curr_code_substrs.append(
                             PEP484585_CODE_HINT_TUPLE_FIXED_EMPTY_format(
+                                indent_curr=indent_curr,
                                 pith_curr_var_name=(
                                     pith_curr_var_name),
                             ))
@@ -1555,11 +1597,12 @@ def make_check_expr(
                     # case...
                     else:
                         # Append code type-checking the length of this pith.
-                        func_curr_code += (
+                        func_curr_code_substrs.append(
                             PEP484585_CODE_HINT_TUPLE_FIXED_LEN_format(
+                                indent_curr=indent_curr,
                                 pith_curr_var_name=(
                                     pith_curr_var_name),
-                                hint_childs_len=hint_childs_len,
+                                hint_childs_len=str(hint_childs_len),
                             ))
 
                         # For each child hint of this tuple...
@@ -1572,7 +1615,8 @@ def make_check_expr(
                             # Else, this child hint is unignorable.
 
                             # Append code type-checking this child pith.
-                            func_curr_code += PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_CHILD_format(
+                            func_curr_code_substrs.append(PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_CHILD_format(
+                                indent_curr=indent_curr,
                                 hint_child_placeholder=_enqueue_hint_child(
                                     # Python expression yielding the value of
                                     # the currently indexed item of this tuple
@@ -1581,24 +1625,20 @@ def make_check_expr(
                                     PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR_format(
                                         pith_curr_var_name=(
                                             pith_curr_var_name),
-                                        pith_child_index=hint_child_index,
+                                        pith_child_index=str(
+                                            hint_child_index),
                                     )
                                 ),
-                            )
+                            ))
 
                     # Munge this code to...
                     func_curr_code = (
-                        # Strip the erroneous " and" suffix appended by the
-                        # last child hint from this code.
-                        f'{func_curr_code[:_LINE_RSTRIP_INDEX_AND]}'
+                        # Conjunctively join this prefix and the code
+                        # type-checking these child hints.
+                        f'{_CODE_OPERATOR_AND.join(func_curr_code_substrs)}'
                         # Suffix this code by the substring suffixing all such
                         # code.
-                        f'{PEP484585_CODE_HINT_TUPLE_FIXED_SUFFIX}'
-                    # Format...
-                    ).format(
-                        # Indentation deferred above for efficiency.
-                        indent_curr=indent_curr,
-                        pith_curr_assign_expr=pith_curr_assign_expr,
+                        f'{PEP484585_CODE_HINT_TUPLE_FIXED_SUFFIX_format(indent_curr=indent_curr)}'
                     )
                 # Else, this hint is *NOT* a tuple.
                 #
@@ -1620,14 +1660,6 @@ def make_check_expr(
 
                     # Initialize the code type-checking this pith against this
                     # metahint to the substring prefixing all such code.
-                    #
-                    # Note that we intentionally do *NOT* defer formatting
-                    # these variables into this string as we do for most other
-                    # kinds of type hints. Why? Safety. Since caller-defined
-                    # code could theoretically embed substrings accidentally
-                    # matching these variable names, we safely (but
-                    # inefficiently) format these variables into the exact
-                    # strings known to embed them.
                     func_curr_code = (
                         PEP593_CODE_HINT_VALIDATOR_PREFIX_format(
                             indent_curr=indent_curr,
@@ -1647,6 +1679,9 @@ def make_check_expr(
                                 pith_curr_assign_expr),
                         ))
 
+                    # Initialize the list of code snippets to this prefix.
+                    func_curr_code_substrs = [func_curr_code]
+
                     # For each beartype validator annotating this metahint...
                     for hint_child in get_hint_pep593_metadata(hint_curr):
                         # print(f'Type-checking PEP 593 type hint {repr(hint_curr)} argument {repr(hint_child)}...')
@@ -1670,7 +1705,7 @@ def make_check_expr(
 
                         # Generate and append efficient code type-checking this
                         # validator by embedding this code as is.
-                        func_curr_code += (
+                        func_curr_code_substrs.append(
                             PEP593_CODE_HINT_VALIDATOR_CHILD_format(
                                 indent_curr=indent_curr,
                                 # Python expression formatting the current pith
@@ -1693,9 +1728,9 @@ def make_check_expr(
 
                     # Munge this code to...
                     func_curr_code = (
-                        # Strip the erroneous " and" suffix appended by the
-                        # last child hint from this code.
-                        f'{func_curr_code[:_LINE_RSTRIP_INDEX_AND]}'
+                        # Conjunctively join this prefix and the code
+                        # type-checking these child hints.
+                        f'{_CODE_OPERATOR_AND.join(func_curr_code_substrs)}'
                         # Suffix this code by the substring suffixing all such
                         # code.
                         f'{PEP593_CODE_HINT_VALIDATOR_SUFFIX_format(indent_curr=indent_curr)}'
@@ -1809,7 +1844,19 @@ def make_check_expr(
 
                     # Initialize the code type-checking this pith against this
                     # generic to the substring prefixing all such code.
-                    func_curr_code = PEP484585_CODE_HINT_GENERIC_PREFIX
+                    func_curr_code = PEP484585_CODE_HINT_GENERIC_PREFIX_format(
+                        indent_curr=indent_curr,
+                        pith_curr_assign_expr=pith_curr_assign_expr,
+                        # Python expression evaluating to this generic type.
+                        hint_curr_expr=add_func_scope_type(
+                            cls=hint_curr,
+                            func_scope=func_wrapper_scope,
+                            exception_prefix=_EXCEPTION_PREFIX_HINT,
+                        ),
+                    )
+
+                    # Initialize the list of code snippets to this prefix.
+                    func_curr_code_substrs = [func_curr_code]
 
                     # For each unignorable unerased transitive pseudo-superclass
                     # originally declared as a superclass of this generic...
@@ -1822,8 +1869,9 @@ def make_check_expr(
 
                         # Generate and append code type-checking this pith
                         # against this superclass.
-                        func_curr_code += (
+                        func_curr_code_substrs.append(
                             PEP484585_CODE_HINT_GENERIC_CHILD_format(
+                                indent_curr=indent_curr,
                                 hint_child_placeholder=(_enqueue_hint_child(
                                     # Python expression efficiently reusing the
                                     # value of this pith previously assigned to
@@ -1832,23 +1880,12 @@ def make_check_expr(
 
                     # Munge this code to...
                     func_curr_code = (
-                        # Strip the erroneous " and" suffix appended by the
-                        # last child hint from this code.
-                        f'{func_curr_code[:_LINE_RSTRIP_INDEX_AND]}'
+                        # Conjunctively join this prefix and the code
+                        # type-checking these child hints.
+                        f'{_CODE_OPERATOR_AND.join(func_curr_code_substrs)}'
                         # Suffix this code by the substring suffixing all such
                         # code.
-                        f'{PEP484585_CODE_HINT_GENERIC_SUFFIX}'
-                    # Format...
-                    ).format(
-                        # Indentation deferred above for efficiency.
-                        indent_curr=indent_curr,
-                        pith_curr_assign_expr=pith_curr_assign_expr,
-                        # Python expression evaluating to this generic type.
-                        hint_curr_expr=add_func_scope_type(
-                            cls=hint_curr,
-                            func_scope=func_wrapper_scope,
-                            exception_prefix=_EXCEPTION_PREFIX_HINT,
-                        ),
+                        f'{PEP484585_CODE_HINT_GENERIC_SUFFIX_format(indent_curr=indent_curr)}'
                     )
                     # print(f'{hint_curr_exception_prefix} PEP generic {repr(hint)} handled.')
                 # Else, this hint is *NOT* a generic.
@@ -1881,38 +1918,106 @@ def make_check_expr(
                         exception_prefix=_EXCEPTION_PREFIX,
                     )
 
-                    # Initialize the code type-checking this pith against this
-                    # hint to the substring prefixing all such code.
-                    func_curr_code = PEP586_CODE_HINT_PREFIX_format(
-                        pith_curr_assign_expr=pith_curr_assign_expr,
-
-                        #FIXME: If "typing.Literal" is ever extended to support
-                        #substantially more types (and thus actually becomes
-                        #useful), optimize the construction of the "types" set
-                        #below to instead leverage a similar
-                        #"acquire_object_typed(set)" caching solution as that
-                        #currently employed for unions. For now, we only shrug.
-
-                        # Python expression evaluating to a tuple of the unique
-                        # types of all literal objects subscripting this hint.
-                        hint_child_types_expr=add_func_scope_types(
-                            # Set comprehension of all unique literal objects
-                            # subscripting this hint, implicitly discarding all
-                            # duplicate such objects.
-                            types={
-                                type(hint_child)
-                                for hint_child in hint_childs
-                            },
-                            func_scope=func_wrapper_scope,
-                            exception_prefix=_EXCEPTION_PREFIX_HINT,
-                        ),
+                    #FIXME: If "typing.Literal" is ever extended to support
+                    #substantially more types (and thus actually becomes
+                    #useful), optimize the construction of the "types" set
+                    #below to instead leverage a similar
+                    #"acquire_object_typed(set)" caching solution as that
+                    #currently employed for unions. For now, we only shrug.
+
+                    # Set of the unique types of all literal objects
+                    # subscripting this hint, implicitly discarding all
+                    # duplicate such types.
+                    hint_child_types = {
+                        type(hint_child) for hint_child in hint_childs}
+
+                    # Python expression evaluating to a tuple of these types.
+                    hint_curr_expr = add_func_scope_types(
+                        types=hint_child_types,
+                        func_scope=func_wrapper_scope,
+                        exception_prefix=_EXCEPTION_PREFIX_HINT,
                     )
 
+                    # Attempt to coerce this tuple into a frozen set of these
+                    # literal objects. Since all literal objects permitted by
+                    # PEP 586 (e.g., booleans, integers, strings) are hashable,
+                    # this *ALMOST* always succeeds.
+                    try:
+                        hint_childs_set = frozenset(hint_childs)
+                    # If one or more of these objects are unhashable (e.g., a
+                    # member of an enumeration overriding the __eq__() but
+                    # *NOT* __hash__() dunder methods), fallback to type-checking
+                    # this pith against each literal object in turn below.
+                    except TypeError:
+                        hint_childs_set = None
+
+                    # If these literal objects are all hashable, initialize
+                    # the code type-checking this pith against these literal
+                    # objects to the substring prefixing all such code,
+                    # type-checking piths whose types are exactly the types of
+                    # these literal objects by a single O(1) membership test
+                    # against this set.
+                    if hint_childs_set is not None:
+                        func_curr_code = PEP586_CODE_HINT_HASHABLE_PREFIX_format(
+                            indent_curr=indent_curr,
+                            pith_curr_assign_expr=pith_curr_assign_expr,
+                            pith_curr_var_name=pith_curr_var_name,
+                            hint_child_types_expr=hint_curr_expr,
+                            # Python expression evaluating to a tuple of these
+                            # types. Unlike the "hint_curr_expr" expression,
+                            # this expression is guaranteed to evaluate to a
+                            # tuple even when these literal objects all share
+                            # the same type. Since testing tuple membership
+                            # compares by identity and equality rather than
+                            # hashing, testing whether the type of this pith
+                            # is in this tuple is safe for *ALL* piths --
+                            # including instances of unhashable metaclasses.
+                            hint_child_types_tuple_expr=add_func_scope_attr(
+                                attr=tuple(hint_child_types),
+                                func_scope=func_wrapper_scope,
+                                exception_prefix=(
+                                    _EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
+                            ),
+                            # Python expression evaluating to this set.
+                            hint_childs_expr=add_func_scope_attr(
+                                attr=hint_childs_set,
+                                func_scope=func_wrapper_scope,
+                                exception_prefix=(
+                                    _EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
+                            ),
+                        )
+                        func_curr_code_suffix = (
+                            PEP586_CODE_HINT_HASHABLE_SUFFIX_format(
+                                indent_curr=indent_curr))
+                    # Else, one or more of these literal objects are
+                    # unhashable. In this case, initialize the code
+                    # type-checking this pith against these literal objects to
+                    # the substring prefixing all such code.
+                    else:
+                        func_curr_code = PEP586_CODE_HINT_PREFIX_format(
+                            indent_curr=indent_curr,
+                            pith_curr_assign_expr=pith_curr_assign_expr,
+                            hint_child_types_expr=hint_curr_expr,
+                        )
+                        func_curr_code_suffix = PEP586_CODE_HINT_SUFFIX_format(
+                            indent_curr=indent_curr)
+
+                    # In either case, type-check this pith against each literal
+                    # object with an O(n) disjunction of equality comparisons.
+                    # Although the former case only performs these comparisons
+                    # for piths that are instances of subclasses of the types
+                    # of these literal objects, the latter case performs these
+                    # comparisons for *ALL* piths.
+                    #
+                    # Initialize the list of code snippets to the empty list.
+                    func_curr_code_substrs = []
+
                     # For each literal object subscripting this hint...
                     for hint_child in hint_childs:
                         # Generate and append efficient code type-checking
                         # this data validator by embedding this code as is.
-                        func_curr_code += PEP586_CODE_HINT_LITERAL_format(
+                        func_curr_code_substrs.append(PEP586_CODE_HINT_LITERAL_format(
+                            indent_curr=indent_curr,
                             pith_curr_var_name=pith_curr_var_name,
                             # Python expression evaluating to this object.
                             hint_child_expr=add_func_scope_attr(
@@ -1921,16 +2026,19 @@ def make_check_expr(
                                 exception_prefix=(
                                     _EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
                             ),
-                        )
+                        ))
 
                     # Munge this code to...
                     func_curr_code = (
-                        # Strip the erroneous " or" suffix appended by the last
-                        # child hint from this code.
-                        f'{func_curr_code[:_LINE_RSTRIP_INDEX_OR]}'
+                        # Prefix this code by the substring prefixing all such
+                        # code.
+                        f'{func_curr_code}'
+                        # Disjunctively join the code type-checking these
+                        # literal objects.
+                        f'{_CODE_OPERATOR_OR.join(func_curr_code_substrs)}'
                         # Suffix this code by the appropriate substring.
-                        f'{PEP586_CODE_HINT_SUFFIX}'
-                    ).format(indent_curr=indent_curr)
+                        f'{func_curr_code_suffix}'
+                    )
                 # Else, this hint is *NOT* a PEP 586-compliant type hint.
 
                 # ............{ UNSUPPORTED                        }............
@@ -1998,39 +2106,102 @@ def make_check_expr(
             )
 
         # ................{ CLEANUP                            }................
-        # Inject this code into the body of this wrapper.
-        func_wrapper_code = replace_str_substrs(
-            text=func_wrapper_code,
-            old=hint_curr_placeholder,
-            new=func_curr_code,
-        )
-
-        # Nullify the metadata describing the previously visited hint in this
-        # list for safety.
-        hints_meta[hints_meta_index_curr] = None
+        # Replace the metadata describing the currently visited hint in this
+        # list by the code type-checking the current pith against this hint.
+        # Since this metadata is no longer required, this list is safely
+        # reused to record this code until resolving all child placeholders
+        # below.
+        #
+        # Note that this code is intentionally *NOT* injected into the body of
+        # this wrapper here, as doing so would globally replace this hint's
+        # placeholder by scanning the entirety of this body once for each
+        # visited hint and thus exhibit quadratic time complexity in the number
+        # of visited hints.
+        hints_meta[hints_meta_index_curr] = func_curr_code
 
         # Increment the 0-based index of metadata describing the next visited
         # hint in the "hints_meta" list *BEFORE* visiting that hint but *AFTER*
         # performing all other logic for the currently visited hint.
         hints_meta_index_curr += 1
 
+    # ..................{ RESOLVE                            }..................
+    # For the 0-based index of each visited hint in descending order, resolve
+    # all child placeholders embedded in the code type-checking this hint by
+    # a single linear scan over that code. Since the breadth-first search
+    # above enqueues each child hint at an index strictly greater than that of
+    # its parent hint, the code of all child hints of each hint has already
+    # been fully resolved by the time that hint is resolved.
+    #
+    # Note that this iteration intentionally resolves the root hint at index 0
+    # last. Note also that this iteration intentionally reuses the
+    # "hints_meta_index_curr" index rather than decrementing the
+    # "hints_meta_index_last" index, which the validation below requires.
+    hints_meta_index_curr = hints_meta_index_last
+    while hints_meta_index_curr >= 0:
+        # List of all substrings of the code type-checking this hint split on
+        # the single-character prefix of each child placeholder, such that the
+        # first substring precedes the first child placeholder (if any) and
+        # each subsequent substring is prefixed by the 0-based index of the
+        # child hint identified by the preceding child placeholder.
+        func_curr_code_substrs = hints_meta[hints_meta_index_curr].split(
+            _PEP_CODE_HINT_CHILD_PLACEHOLDER_PREFIX)
+
+        # For the 0-based index of each such subsequent substring...
+        for func_curr_code_substr_index in range(
+            1, len(func_curr_code_substrs)):
+            # 0-based index of the child hint identified by the child
+            # placeholder preceding this substring and the remainder of this
+            # substring following that placeholder.
+            hint_child_id, _, func_curr_code_substr = func_curr_code_substrs[
+                func_curr_code_substr_index].partition(
+                    _PEP_CODE_HINT_CHILD_PLACEHOLDER_SUFFIX)
+
+            # If this placeholder is malformed (e.g., due to the code generated
+            # above embedding the placeholder prefix character as a literal),
+            # raise an exception.
+            try:
+                hint_child_index = int(hint_child_id)
+            except ValueError as exception:
+                raise BeartypeDecorHintPepException(
+                    f'{_EXCEPTION_PREFIX_HINT}{repr(hint_root)} '
+                    f'child placeholder "{hint_child_id}" malformed.'
+                ) from exception
+            # Else, this placeholder is well-formed.
+
+            # Replace this placeholder by the code type-checking this child
+            # hint. Since each child placeholder is embedded exactly once in
+            # the code generated above, nullify that code for safety.
+            func_curr_code_substrs[func_curr_code_substr_index] = (
+                f'{hints_meta[hint_child_index]}{func_curr_code_substr}')
+            hints_meta[hint_child_index] = None
+
+        # Fully resolved code type-checking this hint.
+        hints_meta[hints_meta_index_curr] = ''.join(func_curr_code_substrs)
+        hints_meta_index_curr -= 1
+
+    # If the code type-checking any child hint was *NOT* embedded in the code
+    # type-checking its parent hint (i.e., if that parent hint omitted the
+    # placeholder for that child hint), raise an exception. Since the loop
+    # above nullifies the code of each child hint after embedding that code,
+    # the code of *ALL* child hints should now be nullified.
+    for hints_meta_index_curr in range(1, hints_meta_index_last + 1):
+        if hints_meta[hints_meta_index_curr] is not None:
+            raise BeartypeDecorHintPepException(
+                f'{_EXCEPTION_PREFIX_HINT}{repr(hint_root)} '
+                f'child hint code at index {hints_meta_index_curr} '
+                f'unchecked (i.e., child placeholder not embedded in '
+                f'parent hint code).'
+            )
+    # Else, the code of all child hints was embedded.
+
+    # Python code snippet type-checking the root pith against the root hint.
+    func_wrapper_code = hints_meta[0]
+    hints_meta[0] = None
+
     # ..................{ CLEANUP                            }..................
     # Release the fixed list of all such metadata.
     release_fixed_list(hints_meta)
 
-    # If the Python code snippet to be returned remains unchanged from its
-    # initial value, the breadth-first search above failed to generate code. In
-    # this case, raise an exception.
-    #
-    # Note that this test is inexpensive, as the third character of the
-    # "func_root_code" code snippet is guaranteed to differ from that of
-    # "func_wrapper_code" code snippet if this function behaved as expected,
-    # which it should have... but may not have, which is why we're testing.
-    if func_wrapper_code == func_root_code:
-        raise BeartypeDecorHintPepException(
-            f'{_EXCEPTION_PREFIX_HINT}{repr(hint_root)} unchecked.')
-    # Else, the breadth-first search above successfully generated code.
-
     # ..................{ CODE ~ locals                      }..................
     # If type-checking for the root pith requires the type stack...
     if cls_stack:
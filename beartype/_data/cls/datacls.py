@@ -37,6 +37,8 @@ from beartype._cave._cavefast import (
     NoneType,
     NotImplementedType,
 )
+from beartype._data.module.datamodpy import BUILTINS_MODULE_NAME
+import builtins
 
 # ....................{ BEARTYPEABLE                       }....................
 # Types of *ALL* objects that may be decorated by @beartype, intentionally
@@ -113,6 +115,30 @@ See Also
     as an essential sanity check on that runtime-specific set.
 '''
 
+
+TYPES_BUILTIN = frozenset(
+    builtin
+    for builtin in vars(builtins).values()
+    if (
+        isinstance(builtin, type) and
+        builtin.__module__ == BUILTINS_MODULE_NAME
+    )
+) - TYPES_BUILTIN_FAKE
+'''
+Frozen set of all **real builtin types** (i.e., types declared by the standard
+:mod:`builtins` module that are also globally accessible as attributes of that
+module, including :class:`int`, :class:`str`, and all builtin exception types).
+
+This set is a strict subset of the set of all builtin types and thus *only* a
+fast path. Builtin types that are *not* globally accessible (e.g.,
+:class:`list_iterator`, the type of the :func:`len` builtin function) are
+intentionally excluded, as distinguishing these types from fake builtin types
+requires further introspection. Testers *must* therefore fall back to
+inspecting the ``__module__`` dunder attribute of types *not* in this set, as a
+bare set membership test would erroneously reject these non-global builtin
+types.
+'''
+
 # ....................{ STRINGS                            }....................
 TYPE_BUILTIN_FAKE_PYCAPSULE_NAME = 'PyCapsule'
 '''
@@ -21,12 +21,20 @@ from beartype._data.hint.datahinttyping import (
     TypeStack,
 )
 from beartype._decor.wrap.wrapsnip import (
-    CODE_HINT_ROOT_PREFIX,
-    CODE_HINT_ROOT_SUFFIX,
+    CODE_HINT_ROOT,
     CODE_HINT_ROOT_SUFFIX_CLS_STACK,
     CODE_HINT_ROOT_SUFFIX_RANDOM_INT,
 )
 from beartype._util.cache.utilcachecall import callable_cached
+from beartype._util.text.utiltextformat import FormatPlan
+
+# ....................{ PRIVATE ~ formatters               }....................
+_CODE_HINT_ROOT_format = FormatPlan(CODE_HINT_ROOT).format
+'''
+Bound :meth:`beartype._util.text.utiltextformat.FormatPlan.format` method of
+the format plan precompiled from the :data:`.CODE_HINT_ROOT` snippet at import
+time.
+'''
 
 # ....................{ MAKERS                             }....................
 @callable_cached
@@ -91,40 +99,21 @@ def make_func_wrapper_code(
 
     # Code snippet passing the value of the random integer previously generated
     # for the current call to the exception-handling function call embedded in
-    # the "CODE_HINT_ROOT_SUFFIX" snippet, defaulting to *NOT* passing this.
+    # the "CODE_HINT_ROOT" snippet, defaulting to *NOT* passing this.
     arg_random_int = (
         CODE_HINT_ROOT_SUFFIX_RANDOM_INT
         if ARG_NAME_GETRANDBITS in func_wrapper_scope else
         ''
     )
 
-    #FIXME: [SPEED] Optimize the following two string munging operations into a
-    #single string-munging operation resembling:
-    #    func_wrapper_code = CODE_HINT_ROOT.format(
-    #        check_expr=func_wrapper_code_expr,
-    #        random_int_if_any=arg_random_int
-    #    )
-    #
-    #Then define "CODE_HINT_ROOT" in the "wrapsnip" submodule to resemble:
-    #    CODE_HINT_ROOT = (
-    #        f'{CODE_HINT_ROOT_PREFIX}{{check_expr}}'
-    #        f'{CODE_HINT_ROOT_SUFFIX}'
-    #    )
-
-    # Suffix this code by a Python code snippet raising a human-readable
-    # exception when the root pith violates the root type hint.
-    func_wrapper_code_suffix = CODE_HINT_ROOT_SUFFIX.format(
+    # Python code snippet type-checking the root pith against the root hint,
+    # raising a human-readable exception when that pith violates that hint.
+    func_wrapper_code = _CODE_HINT_ROOT_format(
+        check_expr=func_wrapper_code_expr,
         arg_cls_stack=arg_cls_stack,
         arg_random_int=arg_random_int,
     )
 
-    # Python code snippet type-checking the root pith against the root hint.
-    func_wrapper_code = (
-        f'{CODE_HINT_ROOT_PREFIX}'
-        f'{func_wrapper_code_expr}'
-        f'{func_wrapper_code_suffix}'
-    )
-
     # Return all metadata required by higher-level callers.
     return (
         func_wrapper_code,
@@ -51,9 +51,10 @@ from beartype._data.func.datafuncarg import (
 )
 from beartype._decor.wrap.wrapsnip import (
     CODE_INIT_ARGS_LEN,
+    CODE_LOCALIZE_KEYWORD_ONLY_MANDATORY,
+    CODE_LOCALIZE_VAR_POSITIONAL_ALL,
     CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER,
-    CODE_RETURN_CHECK_PREFIX,
-    CODE_RETURN_CHECK_SUFFIX,
+    CODE_RETURN_CHECK,
     CODE_RETURN_UNCHECKED,
     CODE_SIGNATURE,
     PARAM_KIND_TO_CODE_LOCALIZE,
@@ -65,9 +66,11 @@ from beartype._util.error.utilerror import (
     reraise_exception_placeholder,
 )
 from beartype._util.func.arg.utilfuncargiter import (
+    ARG_META_INDEX_DEFAULT,
     ARG_META_INDEX_KIND,
     ARG_META_INDEX_NAME,
     ArgKind,
+    ArgMandatory,
     iter_func_args,
 )
 from beartype._util.hint.pep.proposal.pep484585.utilpep484585ref import (
@@ -77,6 +80,7 @@ from beartype._util.hint.utilhinttest import (
     is_hint_needs_cls_stack,
 )
 from beartype._util.kind.utilkinddict import update_mapping
+from beartype._util.text.utiltextformat import FormatPlan
 from beartype._util.text.utiltextmunge import replace_str_substrs
 from beartype._util.text.utiltextprefix import (
     prefix_beartypeable_arg,
@@ -87,14 +91,19 @@ from collections.abc import (
     Callable,
     Iterable,
 )
+from re import (
+    compile as re_compile,
+    escape as re_escape,
+)
 
 # ....................{ GENERATORS                         }....................
 def generate_code(
     bear_call: BeartypeCall,
 
     # "beartype._decor.wrap.wrapsnip" string globals required only for
-    # their bound "str.format" methods.
-    CODE_RETURN_UNCHECKED_format: Callable = CODE_RETURN_UNCHECKED.format,
+    # the bound "format" methods of format plans precompiled from them.
+    CODE_RETURN_UNCHECKED_format: Callable = (
+        FormatPlan(CODE_RETURN_UNCHECKED).format),
 ) -> str:
     '''
     Generate a Python code snippet dynamically defining the wrapper function
@@ -262,6 +271,68 @@ Frozen set of all **positional parameter kinds** (i.e.,
 either may *or* must be passed positionally).
 '''
 
+
+_PARAM_KIND_TO_CODE_LOCALIZE_PLAN = {
+    arg_kind: FormatPlan(code_param_localize)
+    for arg_kind, code_param_localize in PARAM_KIND_TO_CODE_LOCALIZE.items()
+}
+'''
+Dictionary mapping from the type of each callable parameter supported by the
+:func:`beartype.beartype` decorator to the format plan precompiled from the
+corresponding code snippet of the :data:`.PARAM_KIND_TO_CODE_LOCALIZE`
+dictionary.
+'''
+
+
+_CODE_LOCALIZE_KEYWORD_ONLY_MANDATORY_PLAN = FormatPlan(
+    CODE_LOCALIZE_KEYWORD_ONLY_MANDATORY)
+'''
+Format plan precompiled from the :data:`.CODE_LOCALIZE_KEYWORD_ONLY_MANDATORY`
+code snippet.
+'''
+
+
+_CODE_LOCALIZE_VAR_POSITIONAL_ALL_PLAN = FormatPlan(
+    CODE_LOCALIZE_VAR_POSITIONAL_ALL)
+'''
+Format plan precompiled from the :data:`.CODE_LOCALIZE_VAR_POSITIONAL_ALL`
+code snippet.
+'''
+
+
+_CODE_RETURN_CHECK_PLAN = FormatPlan(CODE_RETURN_CHECK)
+'''
+Format plan precompiled from the :data:`.CODE_RETURN_CHECK` code snippet.
+'''
+
+
+_PEP484_CODE_CHECK_NORETURN_PLAN = FormatPlan(PEP484_CODE_CHECK_NORETURN)
+'''
+Format plan precompiled from the :data:`.PEP484_CODE_CHECK_NORETURN` code
+snippet.
+'''
+
+
+_CODE_PLACEHOLDER_REGEX = re_compile(
+    # Match either the root pith name placeholder...
+    f'{re_escape(CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER)}|'
+    # Or any relative forward reference placeholder.
+    f'{re_escape(PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_PREFIX)}'
+    f'[^{re_escape(PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_SUFFIX)}]+'
+    f'{re_escape(PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_SUFFIX)}'
+)
+'''
+Compiled regular expression matching each placeholder substring memoized into
+code generated by the :func:`.make_func_wrapper_code` factory to be
+subsequently unmemoized by the :func:`._unmemoize_func_wrapper_code` function
+(i.e., either the :data:`.CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER` substring *or*
+any relative forward reference placeholder substring).
+
+This expression enables all such placeholders to be resolved by a single linear
+scan over that code rather than by one global :meth:`str.replace` call per
+placeholder.
+'''
+
 # ....................{ PRIVATE ~ args                     }....................
 def _code_check_args(bear_call: BeartypeCall) -> str:
     '''
@@ -316,8 +387,10 @@ def _code_check_args(bear_call: BeartypeCall) -> str:
         return ''
     # Else, one or more callable parameters are annotated.
 
-    # Python code snippet to be returned.
-    func_wrapper_code = ''
+    # List of all Python code snippets type-checking each parameter, joined
+    # into the single code snippet to be returned *AFTER* visiting all such
+    # parameters rather than repeatedly concatenated while doing so.
+    func_wrapper_code_substrs = []
 
     # ..................{ LOCALS ~ parameter                 }..................
     #FIXME: Remove this *AFTER* optimizing signature generation, please.
@@ -417,7 +490,7 @@ def _code_check_args(bear_call: BeartypeCall) -> str:
             #FIXME: Preserved in the event of a new future unsupported parameter kind.
             # Python code template localizing this parameter if this kind of
             # parameter is supported *OR* "None" otherwise.
-            PARAM_LOCALIZE_TEMPLATE = PARAM_KIND_TO_CODE_LOCALIZE.get(  # type: ignore
+            PARAM_LOCALIZE_TEMPLATE = _PARAM_KIND_TO_CODE_LOCALIZE_PLAN.get(  # type: ignore
                 arg_kind, None)
 
             # If this kind of parameter is unsupported, raise an exception.
@@ -431,6 +504,22 @@ def _code_check_args(bear_call: BeartypeCall) -> str:
                 )
             # Else, this kind of parameter is supported. Ergo, this code is
             # non-"None".
+            #
+            # If this is a variadic positional parameter preceded by *NO*
+            # other parameters, this parameter is passed as the entirety of
+            # the wrapper's variadic "*args" tuple. In this case, prefer a
+            # snippet iterating over that tuple directly.
+            elif arg_kind is ArgKind.VAR_POSITIONAL and not arg_index:
+                PARAM_LOCALIZE_TEMPLATE = _CODE_LOCALIZE_VAR_POSITIONAL_ALL_PLAN
+            # If this is a mandatory keyword-only parameter, this parameter is
+            # passed by all valid calls. In this case, prefer a snippet
+            # optimized for the case in which this parameter is passed.
+            elif (
+                arg_kind is ArgKind.KEYWORD_ONLY and
+                arg_meta[ARG_META_INDEX_DEFAULT] is ArgMandatory
+            ):
+                PARAM_LOCALIZE_TEMPLATE = (
+                    _CODE_LOCALIZE_KEYWORD_ONLY_MANDATORY_PLAN)
 
             # Type stack if required by this hint *OR* "None" otherwise. See the
             # is_hint_needs_cls_stack() tester for further discussion.
@@ -460,7 +549,7 @@ def _code_check_args(bear_call: BeartypeCall) -> str:
 
             # Python code snippet localizing this parameter.
             code_param_localize = PARAM_LOCALIZE_TEMPLATE.format(
-                arg_name=arg_name, arg_index=arg_index)
+                arg_name_repr=repr(arg_name), arg_index=str(arg_index))
 
             # Unmemoize this snippet against the current parameter.
             code_param_check = _unmemoize_func_wrapper_code(
@@ -471,7 +560,8 @@ def _code_check_args(bear_call: BeartypeCall) -> str:
             )
 
             # Append code type-checking this parameter against this hint.
-            func_wrapper_code += f'{code_param_localize}{code_param_check}'
+            func_wrapper_code_substrs.append(code_param_localize)
+            func_wrapper_code_substrs.append(code_param_check)
         # If any exception was raised, reraise this exception with each
         # placeholder substring (i.e., "EXCEPTION_PLACEHOLDER" instance)
         # replaced by a human-readable description of this callable and
@@ -487,6 +577,9 @@ def _code_check_args(bear_call: BeartypeCall) -> str:
                     func=bear_call.func_wrappee, arg_name=arg_name),
             )
 
+    # Python code snippet type-checking all parameters.
+    func_wrapper_code = ''.join(func_wrapper_code_substrs)
+
     # If this callable accepts one or more positional type-checked parameters,
     # prefix this code by a snippet localizing the number of these parameters.
     if is_args_positional:
@@ -575,7 +668,7 @@ def _code_check_return(bear_call: BeartypeCall) -> str:
         if hint is NoReturn:
             # Default this snippet to a pre-generated snippet validating this
             # callable to *NEVER* successfully return. Yup!
-            func_wrapper_code = PEP484_CODE_CHECK_NORETURN.format(
+            func_wrapper_code = _PEP484_CODE_CHECK_NORETURN_PLAN.format(
                 func_call_prefix=bear_call.func_wrapper_code_call_prefix)
         # Else, this is *NOT* "typing.NoReturn". In this case...
         else:
@@ -623,33 +716,14 @@ def _code_check_return(bear_call: BeartypeCall) -> str:
                         hint_forwardrefs_class_basename),
                 )
 
-                #FIXME: [SPEED] Optimize the following two string munging
-                #operations into a single string-munging operation resembling:
-                #    func_wrapper_code = CODE_RETURN_CHECK.format(
-                #        func_call_prefix=bear_call.func_wrapper_code_call_prefix,
-                #        check_expr=code_return_check_pith_unmemoized,
-                #    )
-                #
-                #Then define "CODE_RETURN_CHECK" in the "wrapsnip" submodule to
-                #resemble:
-                #    CODE_RETURN_CHECK = (
-                #        f'{CODE_RETURN_CHECK_PREFIX}{{check_expr}}'
-                #        f'{CODE_RETURN_CHECK_SUFFIX}'
-                #    )
-
-                # Python code snippet type-checking this return.
-                code_return_check_prefix = CODE_RETURN_CHECK_PREFIX.format(
-                    func_call_prefix=bear_call.func_wrapper_code_call_prefix)
-
-                # Return a Python code snippet:
+                # Python code snippet:
                 # * Calling the decorated callable and localize its return
                 #   *AND*...
                 # * Type-checking this return *AND*...
                 # * Returning this return from this wrapper function.
-                func_wrapper_code = (
-                    f'{code_return_check_prefix}'
-                    f'{code_return_check_pith_unmemoized}'
-                    f'{CODE_RETURN_CHECK_SUFFIX}'
+                func_wrapper_code = _CODE_RETURN_CHECK_PLAN.format(
+                    func_call_prefix=bear_call.func_wrapper_code_call_prefix,
+                    check_expr=code_return_check_pith_unmemoized,
                 )
             # Else, this PEP-compliant hint is ignorable.
             # if not func_wrapper_code: print(f'Ignoring {bear_call.func_name} return hint {repr(hint)}...')
@@ -677,7 +751,7 @@ def _unmemoize_func_wrapper_code(
     return of the decorated callable into an "unmemoized" code snippet
     type-checking a specific parameter or return of that callable.
 
-    Specifically, this function (in order):
+    Specifically, this function (in a single linear scan over this code):
 
     #. Globally replaces all references to the
        :data:`.CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER` placeholder substring
@@ -717,49 +791,67 @@ def _unmemoize_func_wrapper_code(
     assert isinstance(hint_forwardrefs_class_basename, Iterable), (
         f'{repr(hint_forwardrefs_class_basename)} not iterable.')
 
-    # Generate an unmemoized parameter-specific code snippet type-checking this
-    # parameter by replacing in this parameter-agnostic code snippet...
-    func_wrapper_code = replace_str_substrs(
-        text=func_wrapper_code,
-        # This placeholder substring cached into this code with...
-        old=CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER,
-        # This object representation of the name of this parameter or return.
-        new=pith_repr,
-    )
+    # If this code contains *NO* relative forward reference placeholder
+    # substrings memoized into this code, this code contains *ONLY* the root
+    # pith name placeholder substring. In this case, generate an unmemoized
+    # parameter-specific code snippet type-checking this parameter by
+    # globally replacing in this parameter-agnostic code snippet...
+    if not hint_forwardrefs_class_basename:
+        return replace_str_substrs(
+            text=func_wrapper_code,
+            # This placeholder substring cached into this code with...
+            old=CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER,
+            # This object representation of the name of this parameter or
+            # return.
+            new=pith_repr,
+        )
+    # Else, this code contains one or more relative forward reference
+    # placeholder substrings memoized into this code. In this case, unmemoize
+    # this code by globally resolving these placeholders relative to the
+    # decorated callable.
+
+    # Callable currently being decorated by @beartype.
+    func = bear_call.func_wrappee
+
+    # Pass the beartypistry singleton as a private "__beartypistry" parameter
+    # to this wrapper function.
+    bear_call.func_wrapper_scope[ARG_NAME_TYPISTRY] = bear_typistry
+
+    # Dictionary mapping from each placeholder substring cached into this code
+    # to the Python code snippet replacing that placeholder, initialized to map
+    # the root pith name placeholder to the object representation of the name
+    # of this parameter or return.
+    placeholder_to_code = {CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER: pith_repr}
+
+    # For each unqualified classname referred to by a relative forward
+    # reference type hints visitable from the current root type hint, map the
+    # placeholder substring cached into this code for this classname to...
+    for hint_forwardref_class_basename in hint_forwardrefs_class_basename:
+        placeholder_to_code[
+            f'{PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_PREFIX}'
+            f'{hint_forwardref_class_basename}'
+            f'{PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_SUFFIX}'
+        ] = get_hint_forwardref_code(
+            # A Python expression evaluating to this class when accessed via
+            # the private "__beartypistry" parameter, referring to the
+            # fully-qualified classname referred to by this forward reference
+            # relative to the decorated callable.
+            get_hint_pep484585_forwardref_classname_relative_to_object(
+                hint=hint_forwardref_class_basename, obj=func)
+        )
 
-    # If this code contains one or more relative forward reference placeholder
-    # substrings memoized into this code, unmemoize this code by globally
-    # resolving these placeholders relative to the decorated callable.
-    if hint_forwardrefs_class_basename:
-        # Callable currently being decorated by @beartype.
-        func = bear_call.func_wrappee
-
-        # Pass the beartypistry singleton as a private "__beartypistry"
-        # parameter to this wrapper function.
-        bear_call.func_wrapper_scope[ARG_NAME_TYPISTRY] = bear_typistry
-
-        # For each unqualified classname referred to by a relative forward
-        # reference type hints visitable from the current root type hint...
-        for hint_forwardref_class_basename in hint_forwardrefs_class_basename:
-            # Generate an unmemoized callable-specific code snippet checking
-            # this class by globally replacing in this callable-agnostic code...
-            func_wrapper_code = replace_str_substrs(
-                text=func_wrapper_code,
-                # This placeholder substring cached into this code with...
-                old=(
-                    f'{PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_PREFIX}'
-                    f'{hint_forwardref_class_basename}'
-                    f'{PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_SUFFIX}'
-                ),
-                # Python expression evaluating to this class when accessed
-                # via the private "__beartypistry" parameter.
-                new=get_hint_forwardref_code(
-                    # Fully-qualified classname referred to by this forward
-                    # reference relative to the decorated callable.
-                    get_hint_pep484585_forwardref_classname_relative_to_object(
-                        hint=hint_forwardref_class_basename, obj=func)
-                ),
-            )
+    # Generate an unmemoized callable- and parameter-specific code snippet
+    # type-checking this parameter by replacing all placeholder substrings
+    # cached into this callable- and parameter-agnostic code snippet in a
+    # single linear scan over that snippet.
+    #
+    # Note that these placeholders are intentionally invalid as Python code,
+    # guaranteeing that the subsequent exec() of this code will raise a
+    # "SyntaxError" exception if one or more placeholders remain unreplaced.
+    func_wrapper_code = _CODE_PLACEHOLDER_REGEX.sub(
+        lambda placeholder_match: placeholder_to_code[placeholder_match[0]],
+        func_wrapper_code,
+    )
 
     # Return this unmemoized callable-specific code snippet.
     return func_wrapper_code
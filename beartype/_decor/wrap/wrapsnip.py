@@ -77,11 +77,8 @@ Code snippet prefixing all code type-checking the **root pith** (i.e., value of
 the current parameter or return value) against the root type hint annotating
 that pith.
 
-This prefix is intended to be locally suffixed in the
-:func:`beartype._check.code.codemake.make_func_wrapper_code` function by:
-
-#. The value of the ``hint_child_placeholder`` local variable.
-#. The :data:`.CODE_HINT_ROOT_SUFFIX` suffix.
+This prefix is fused at import time with the :data:`.CODE_HINT_ROOT_SUFFIX`
+suffix into the :data:`.CODE_HINT_ROOT` snippet.
 '''
 
 # ....................{ CODE ~ suffix                      }....................
@@ -141,6 +138,23 @@ generated for the current call to the exception-handling function call embedded
 in the :data:`.CODE_HINT_ROOT_SUFFIX` snippet.
 '''
 
+# ....................{ CODE ~ root                        }....................
+CODE_HINT_ROOT = f'{CODE_HINT_ROOT_PREFIX}{{check_expr}}{CODE_HINT_ROOT_SUFFIX}'
+'''
+Code snippet type-checking the **root pith** (i.e., value of the current
+parameter or return value) against the root type hint annotating that pith,
+fusing the :data:`.CODE_HINT_ROOT_PREFIX` prefix and
+:data:`.CODE_HINT_ROOT_SUFFIX` suffix into a single snippet interpolated by a
+single format call.
+
+This snippet expects to be formatted with these named interpolations:
+
+* ``{check_expr}``, whose value is the Python expression type-checking the root
+  pith against the root type hint.
+* ``{arg_cls_stack}`` and ``{arg_random_int}``, whose values are as documented
+  by the :data:`.CODE_HINT_ROOT_SUFFIX` snippet.
+'''
+
 # ....................{ CODE ~ arg                         }....................
 PARAM_KIND_TO_CODE_LOCALIZE = {
     # Snippet localizing any positional-only parameter (e.g.,
@@ -172,7 +186,7 @@ PARAM_KIND_TO_CODE_LOCALIZE = {
     # sentinel "__beartype_raise_exception" guaranteed to never be passed.
     {VAR_NAME_PITH_ROOT} = (
         args[{{arg_index}}] if {VAR_NAME_ARGS_LEN} > {{arg_index}} else
-        kwargs.get({{arg_name!r}}, {ARG_NAME_RAISE_EXCEPTION})
+        kwargs.get({{arg_name_repr}}, {ARG_NAME_RAISE_EXCEPTION})
     )
 
     # If this parameter was passed...
@@ -183,7 +197,7 @@ PARAM_KIND_TO_CODE_LOCALIZE = {
     ArgKind.KEYWORD_ONLY: f'''
     # Localize this keyword-only parameter if passed *OR* to the sentinel value
     # "__beartype_raise_exception" guaranteed to never be passed.
-    {VAR_NAME_PITH_ROOT} = kwargs.get({{arg_name!r}}, {ARG_NAME_RAISE_EXCEPTION})
+    {VAR_NAME_PITH_ROOT} = kwargs.get({{arg_name_repr}}, {ARG_NAME_RAISE_EXCEPTION})
 
     # If this parameter was passed...
     if {VAR_NAME_PITH_ROOT} is not {ARG_NAME_RAISE_EXCEPTION}:''',
@@ -191,7 +205,7 @@ PARAM_KIND_TO_CODE_LOCALIZE = {
     # Snippet iteratively localizing all variadic positional parameters.
     ArgKind.VAR_POSITIONAL: f'''
     # For all passed variadic positional parameters...
-    for {VAR_NAME_PITH_ROOT} in args[{{arg_index!r}}:]:''',
+    for {VAR_NAME_PITH_ROOT} in args[{{arg_index}}:]:''',
 
     #FIXME: Probably impossible to implement under the standard decorator
     #paradigm, sadly. This will have to wait for us to fundamentally revise
@@ -199,12 +213,65 @@ PARAM_KIND_TO_CODE_LOCALIZE = {
     # # Snippet iteratively localizing all variadic keyword parameters.
     # ArgKind.VAR_KEYWORD: f'''
     # # For all passed variadic keyword parameters...
-    # for {VAR_NAME_PITH_ROOT} in kwargs[{{arg_index!r}}:]:''',
+    # for {VAR_NAME_PITH_ROOT} in kwargs[{{arg_index}}:]:''',
 }
 '''
 Dictionary mapping from the type of each callable parameter supported by the
 :func:`beartype.beartype` decorator to a code snippet localizing that callable's
 next parameter to be type-checked.
+
+Each snippet expects to be formatted with these named interpolations:
+
+* ``{arg_index}``, whose value is the stringified 0-based index of this
+  parameter in the parameter list of the decorated callable's signature.
+* ``{arg_name_repr}``, whose value is the machine-readable representation of
+  the name of this parameter.
+
+Each snippet intentionally avoids replacement fields with conversions (e.g.,
+``{arg_name!r}``), enabling the :mod:`beartype._decor.wrap.wrapmain` submodule
+to precompile these snippets into :class:`.FormatPlan` objects.
+'''
+
+
+CODE_LOCALIZE_VAR_POSITIONAL_ALL = f'''
+    # For all passed variadic positional parameters...
+    for {VAR_NAME_PITH_ROOT} in args:'''
+'''
+Code snippet iteratively localizing all variadic positional parameters of a
+callable accepting *no* other positional parameters (e.g., ``def
+muh_func(*args)``), specializing the :attr:`ArgKind.VAR_POSITIONAL` snippet of
+the :data:`.PARAM_KIND_TO_CODE_LOCALIZE` dictionary.
+
+Since the wrapper's variadic ``*args`` tuple then contains *only* variadic
+positional parameters, this snippet iterates directly over that tuple rather
+than over a slice of that tuple, avoiding the need to build both a slice object
+and a subscription of that tuple by that slice on each call.
+'''
+
+CODE_LOCALIZE_KEYWORD_ONLY_MANDATORY = f'''
+    # Localize this mandatory keyword-only parameter if passed.
+    try:
+        {VAR_NAME_PITH_ROOT} = kwargs[{{arg_name_repr}}]
+    # Else, this parameter was unpassed. Since this parameter is mandatory, the
+    # decorated callable will raise the appropriate exception when called.
+    except KeyError:
+        pass
+    # If this parameter was passed...
+    else:'''
+'''
+Code snippet localizing a **mandatory keyword-only parameter** (i.e.,
+keyword-only parameter with *no* default value, e.g., ``def muh_func(*,
+muh_kwarg)``), specializing the :attr:`ArgKind.KEYWORD_ONLY` snippet of the
+:data:`.PARAM_KIND_TO_CODE_LOCALIZE` dictionary.
+
+Since mandatory keyword-only parameters are passed by *all* valid calls to the
+decorated callable, this snippet optimizes for the case in which this parameter
+is passed. Directly subscripting the wrapper's variadic ``**kwargs``
+dictionary by the name of this parameter inside a ``try`` block both avoids the
+method call performed by the :meth:`dict.get` method *and* avoids comparing
+this parameter against a sentinel. Raising and catching a :exc:`KeyError` is
+comparatively slow, but only occurs for invalid calls that the decorated
+callable rejects anyway.
 '''
 
 # ....................{ CODE ~ return ~ check              }....................
@@ -243,6 +310,26 @@ Code snippet returning from the wrapper function the successfully type-checked
 value returned from the decorated callable.
 '''
 
+
+CODE_RETURN_CHECK = (
+    f'{CODE_RETURN_CHECK_PREFIX}{{check_expr}}{CODE_RETURN_CHECK_SUFFIX}')
+'''
+Code snippet calling the decorated callable, type-checking the value returned by
+that call, and returning that value from the wrapper function.
+
+This snippet is the concatenation of the :data:`.CODE_RETURN_CHECK_PREFIX` and
+:data:`.CODE_RETURN_CHECK_SUFFIX` snippets interleaved with a ``{check_expr}``
+replacement field, enabling callers to generate this code with a single
+formatting rather than a formatting followed by a concatenation.
+
+This snippet expects to be formatted with these named interpolations:
+
+* ``{func_call_prefix}``, whose value is the substring prefixing the call to
+  the decorated callable (e.g., ``await `` for coroutines).
+* ``{check_expr}``, whose value is the Python code type-checking the value
+  returned by that call.
+'''
+
 # ....................{ CODE ~ return ~ check ~ noreturn   }....................
 #FIXME: *FALSE.* The following comment is entirely wrong, sadly. Although that
 #comment does, in fact, apply to asynchronous generators, that comment does
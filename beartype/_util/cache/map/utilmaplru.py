@@ -18,8 +18,6 @@ This private submodule is *not* intended for importation by downstream callers.
 #
 #For thread-safety, the entire "CacheLruStrong" class *MUST* be rethought along
 #the manner of the comparable "utilmapbig.CacheUnboundedStrong" class. Notably:
-#* "CacheLruStrong" class should *NOT* directly subclass "dict" but instead
-#  simply contain a "_dict" instance.
 #* Thread-unsafe dunder methods (particularly the "__setitem__" method) should
 #  probably *NOT* be defined at all. Yeah, we know.
 #* A new CacheLruStrong.cache_entry() method resembling the existing
@@ -30,11 +28,16 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 from beartype.roar._roarexc import _BeartypeUtilCacheLruException
-from beartype.typing import Hashable
+from beartype.typing import (
+    Hashable,
+    ItemsView,
+)
+from beartype._util.utilobject import SENTINEL
+from collections import OrderedDict
 from threading import Lock
 
 # ....................{ CLASSES                            }....................
-class CacheLruStrong(dict):
+class CacheLruStrong(object):
     '''
     **Thread-safe strong Least Recently Used (LRU) cache** (i.e., mapping
     limited to some maximum capacity of strongly referenced arbitrary keys
@@ -56,15 +59,35 @@ class CacheLruStrong(dict):
     Note that:
 
     * The equivalent LRU cache employing weak references to keys and/or values
-      may be trivially implemented by swapping this classes inheritance from
-      the builtin :class:`dict` to either of the builtin
+      may be implemented by swapping the type of this cache's backing store
+      from the :class:`collections.OrderedDict` class to either of the builtin
       :class:`weakref.WeakKeyDictionary` or
-      :class:`weakref.WeakValueDictionary`.
+      :class:`weakref.WeakValueDictionary` classes *and* reimplementing
+      reprioritization in terms of deletion and reinsertion.
     * The standard example of a cache-only object is a container iterator
       (e.g., :meth:`dict.items`).
 
+    This cache contains rather than subclasses an ordered dictionary (i.e.,
+    :class:`collections.OrderedDict` instance). Whereas reprioritizing a key of
+    a builtin :class:`dict` requires deleting and then reinserting that key
+    (rehashing that key twice), the C-based
+    :meth:`collections.OrderedDict.move_to_end` method reprioritizes a key by
+    merely splicing the node of that key in its internal doubly-linked list in
+    ``O(1)`` time *without* rehashing that key. Containing rather than
+    subclassing this dictionary additionally:
+
+    * Avoids the per-instance ``__dict__`` that *all* instances of
+      :class:`collections.OrderedDict` subclasses unconditionally carry
+      regardless of ``__slots__``.
+    * Preserves the C-based fast paths of the backing store's dunder methods,
+      which subclasses overriding those methods would otherwise shadow.
+
     Attributes
     ----------
+    _key_to_value : OrderedDict[Hashable, object]
+        Internal **backing store** (i.e., thread-unsafe ordered dictionary
+        mapping from strongly referenced arbitrary keys onto strongly
+        referenced arbitrary values, ordered from least to most recently used).
     _size : int
         **Cache capacity** (i.e., maximum number of key-value pairs persisted
         by this cache).
@@ -85,6 +108,7 @@ class CacheLruStrong(dict):
     # cache dunder methods. Slotting has been shown to reduce read and write
     # costs by approximately ~10%, which is non-trivial.
     __slots__ = (
+        '_key_to_value',
         '_size',
         '_lock',
     )
@@ -107,8 +131,6 @@ class CacheLruStrong(dict):
             integer** (i.e. less than 1).
         '''
 
-        super().__init__()
-
         if not isinstance(size, int):
             raise _BeartypeUtilCacheLruException(
                 f'LRU cache capacity {repr(size)} not integer.')
@@ -116,20 +138,12 @@ class CacheLruStrong(dict):
             raise _BeartypeUtilCacheLruException(
                 f'LRU cache capacity {size} not positive.')
 
+        self._key_to_value: OrderedDict = OrderedDict()
         self._size = size
         self._lock = Lock()
 
 
-    def __getitem__(
-        self,
-        key: Hashable,
-
-        # Superclass methods efficiently localized as default parameters.
-        __contains=dict.__contains__,
-        __getitem=dict.__getitem__,
-        __delitem=dict.__delitem__,
-        __pushitem=dict.__setitem__,
-    ) -> object:
+    def __getitem__(self, key: Hashable) -> object:
         '''
         Return an item previously cached under the passed key *or* raise an
         exception otherwise.
@@ -156,29 +170,19 @@ class CacheLruStrong(dict):
             If this key isn't cached.
         '''
 
-        with self._lock:
-            # Reset this key if it exists.
-            if __contains(self, key):
-                val = __getitem(self, key)
-                __delitem(self, key)
-                __pushitem(self, key, val)
-                return val
+        # Backing store, localized for negligible efficiency.
+        key_to_value = self._key_to_value
 
-            raise KeyError(f'Key Error: {key}')
+        with self._lock:
+            # Value cached under this key if any *OR* raise a "KeyError".
+            val = key_to_value[key]
 
+            # Reset this key to the most recently used key.
+            key_to_value.move_to_end(key)
+            return val
 
-    def __setitem__(
-        self,
-        key: Hashable,
-        value: object,
 
-        # Superclass methods efficiently localized as default parameters.
-        __contains=dict.__contains__,
-        __delitem=dict.__delitem__,
-        __pushitem=dict.__setitem__,
-        __iter=dict.__iter__,
-        __len=dict.__len__,
-    ) -> None:
+    def __setitem__(self, key: Hashable, value: object) -> None:
         '''
         Cache this key-value pair while preserving size constraints.
 
@@ -195,31 +199,57 @@ class CacheLruStrong(dict):
             If this key is not hashable.
         '''
 
+        # Backing store, localized for negligible efficiency.
+        key_to_value = self._key_to_value
+
         with self._lock:
-            if __contains(self, key):
-                __delitem(self, key)
-            __pushitem(self, key, value)
+            # Cache this key-value pair. If this key is already cached, this
+            # replaces the value cached under this key in-place *WITHOUT*
+            # reordering this key; else, this appends this key as the most
+            # recently used key.
+            key_to_value[key] = value
+
+            # Reset this key to the most recently used key. Although redundant
+            # for newly cached keys, unconditionally doing so is cheaper than
+            # first testing whether this key was already cached.
+            key_to_value.move_to_end(key)
+
+            # Prune the least recently used key from this cache if this cache
+            # now exceeds its capacity. Since replacing the value of an
+            # already cached key cannot grow this cache, this only prunes on
+            # caching a new key.
+            if len(key_to_value) > self._size:
+                key_to_value.popitem(last=False)
+
+
+    def __delitem__(self, key: Hashable) -> None:
+        '''
+        Remove the key-value pair cached under the passed key *or* raise an
+        exception otherwise.
 
-            # Prune this cache.
-            if __len(self) > self._size:
-                __delitem(self, next(__iter(self)))
+        Parameters
+        ----------
+        key : Hashable
+            Arbitrary hashable key to be uncached.
 
+        Raises
+        ----------
+        TypeError
+            If this key is not hashable.
+        KeyError
+            If this key isn't cached.
+        '''
 
-    def __contains__(
-        self,
-         key: Hashable,
+        with self._lock:
+            del self._key_to_value[key]
 
-         # Superclass methods efficiently localized as default parameters.
-         __contains=dict.__contains__,
-         __getitem=dict.__getitem__,
-         __delitem=dict.__delitem__,
-         __pushitem=dict.__setitem__,
-     ) -> bool:
+
+    def __contains__(self, key: Hashable) -> bool:
         '''
         Return a boolean indicating whether this key is cached.
 
         If this key is cached, this method implicitly refreshes this key by
-        popping and pushing this key back onto the top of this cache.
+        resetting this key to the most recently used key of this cache.
 
         Parameters
         ----------
@@ -237,11 +267,94 @@ class CacheLruStrong(dict):
             If this key is unhashable.
         '''
 
+        # Backing store, localized for negligible efficiency.
+        key_to_value = self._key_to_value
+
         with self._lock:
-            if __contains(self, key):
-                val = __getitem(self, key)
-                __delitem(self, key)
-                __pushitem(self, key, val)
+            if key in key_to_value:
+                key_to_value.move_to_end(key)
                 return True
 
             return False
+
+
+    def __len__(self) -> int:
+        '''
+        Number of key-value pairs currently cached by this cache.
+        '''
+
+        return len(self._key_to_value)
+
+    # ..................{ GETTERS                            }..................
+    def get(
+        self,
+
+        # Mandatory parameters.
+        key: Hashable,
+
+        # Optional parameters.
+        default: object = None,
+
+        # Hidden parameters, localized for negligible efficiency.
+        _SENTINEL=SENTINEL,
+    ) -> object:
+        '''
+        Value previously cached under the passed key if this key is cached *or*
+        the passed default value otherwise.
+
+        If this key is cached, this method implicitly refreshes this key by
+        resetting this key to the most recently used key of this cache.
+
+        This getter is intentionally named after (and thus a drop-in
+        replacement of) the :meth:`dict.get` method. Unlike the
+        :meth:`__getitem__` dunder method, this getter neither raises nor
+        requires callers to catch a :exc:`KeyError` on cache misses.
+
+        Parameters
+        ----------
+        key : Hashable
+            Arbitrary hashable key to retrieve the cached value of.
+        default : object, optional
+            Arbitrary object to be returned if this key is *not* cached.
+            Defaults to :data:`None`.
+
+        Returns
+        ----------
+        object
+            Either:
+
+            * If this key is cached, the value cached under this key.
+            * Else, this default value.
+
+        Raises
+        ----------
+        TypeError
+            If this key is unhashable.
+        '''
+
+        # Backing store, localized for negligible efficiency.
+        key_to_value = self._key_to_value
+
+        with self._lock:
+            # Value cached under this key if any *OR* the sentinel otherwise.
+            val = key_to_value.get(key, _SENTINEL)
+
+            # If this key is *NOT* cached, return this default value.
+            if val is _SENTINEL:
+                return default
+            # Else, this key is cached.
+
+            # Reset this key to the most recently used key.
+            key_to_value.move_to_end(key)
+            return val
+
+
+    def items(self) -> ItemsView:
+        '''
+        View of all key-value pairs currently cached by this cache, ordered
+        from the least to the most recently used pair.
+
+        Note that iterating this view does *not* reprioritize any keys.
+        '''
+
+        return self._key_to_value.items()
@@ -14,6 +14,7 @@ This private submodule is *not* intended for importation by downstream callers.
 from beartype.roar._roarexc import _BeartypeUtilTypeException
 from beartype._cave._cavefast import TestableTypes as TestableTypesTuple
 from beartype._data.cls.datacls import (
+    TYPES_BUILTIN,
     TYPES_BUILTIN_FAKE,
     TYPE_BUILTIN_FAKE_PYCAPSULE_NAME,
 )
@@ -24,6 +25,32 @@ from beartype._data.hint.datahinttyping import (
 )
 from beartype._util.cache.utilcachecall import callable_cached
 
+# ....................{ PRIVATE ~ globals                  }....................
+_TYPE_IDS_BUILTIN = frozenset(map(id, TYPES_BUILTIN))
+'''
+Frozen set of the object identifiers of all **real builtin types** (i.e., the
+:data:`beartype._data.cls.datacls.TYPES_BUILTIN` set).
+
+Testing whether a type is in this set (e.g., ``id(cls) in _TYPE_IDS_BUILTIN``)
+rather than in the original set (e.g., ``cls in TYPES_BUILTIN``) is safe for
+**unhashable types** (i.e., types whose metaclasses define ``__hash__ =
+None``), for which the latter raises a :exc:`TypeError`. Since the original
+set strongly refers to these types, these identifiers are guaranteed to remain
+valid for the lifetime of the active Python interpreter.
+'''
+
+
+_TYPE_IDS_BUILTIN_FAKE = frozenset(map(id, TYPES_BUILTIN_FAKE))
+'''
+Frozen set of the object identifiers of all **fake builtin types** (i.e., the
+:data:`beartype._data.cls.datacls.TYPES_BUILTIN_FAKE` set).
+
+See Also
+----------
+:data:`._TYPE_IDS_BUILTIN`
+    Further details.
+'''
+
 # ....................{ RAISERS                            }....................
 def die_unless_type(
     # Mandatory parameters.
@@ -200,19 +227,30 @@ def is_type_builtin(cls: type) -> bool:
         If this object is *not* a class.
     '''
 
-    # This return true only if...
-    return (
-        # This is a possibly fake builtin type *AND*...
-        is_type_builtin_or_fake(cls) and
-        # This type is *NOT* a fake builtin. Specifically, neither...
-        not (
-            # This type is a non-PyCapsule fake builtin *NOR*...
-            cls in TYPES_BUILTIN_FAKE or
-            # This type is the PyCapsule fake builtin. See the docstring of this
-            # global for further commentary. There be bugbears here.
-            cls.__name__ == TYPE_BUILTIN_FAKE_PYCAPSULE_NAME
-        # Then this type is a fake builtin. In this case, reject this type.
-        )
+    # If this type is *NOT* a possibly fake builtin type, this type is *NOT*
+    # builtin. Note that this lower-level tester also validates this object to
+    # be a type, raising an exception otherwise.
+    if not is_type_builtin_or_fake(cls):
+        return False
+    # Else, this type is a possibly fake builtin type.
+
+    # If this type is a real builtin type globally accessible from the
+    # "builtins" module (e.g., "int", "str"), this type is builtin. Since this
+    # includes almost all builtin types passed in practice, this trivially
+    # avoids the fake builtin detection performed below.
+    if id(cls) in _TYPE_IDS_BUILTIN:
+        return True
+    # Else, this type is *NOT* a real builtin type globally accessible from the
+    # "builtins" module.
+
+    # Return true only if this type is *NOT* a fake builtin. Specifically,
+    # neither...
+    return not (
+        # This type is a non-PyCapsule fake builtin *NOR*...
+        id(cls) in _TYPE_IDS_BUILTIN_FAKE or
+        # This type is the PyCapsule fake builtin. See the docstring of this
+        # global for further commentary. There be bugbears here.
+        cls.__name__ == TYPE_BUILTIN_FAKE_PYCAPSULE_NAME
     )
 
 
@@ -247,18 +285,26 @@ def is_type_builtin_or_fake(cls: type) -> bool:
         If this object is *not* a class.
     '''
 
-    # Avoid circular import dependencies.
-    from beartype._util.module.utilmodget import (
-        get_object_type_module_name_or_none)
-
     # If this object is *NOT* a type, raise an exception.
     die_unless_type(cls)
     # Else, this object is a type.
 
+    # If this type is a real builtin type globally accessible from the
+    # "builtins" module, this type is builtin.
+    if id(cls) in _TYPE_IDS_BUILTIN:
+        return True
+    # Else, this type is *NOT* a real builtin type globally accessible from the
+    # "builtins" module.
+
     # Fully-qualified name of the module defining this type if this type is
     # defined by a module *OR* "None" otherwise (i.e., if this type is
     # dynamically defined in-memory).
-    cls_module_name = get_object_type_module_name_or_none(cls)
+    #
+    # Note that this object is guaranteed to be a type by the above validation.
+    # Since the higher-level get_object_type_module_name_or_none() getter
+    # reduces to this one-liner when passed a type, this getter is
+    # intentionally inlined here for efficiency.
+    cls_module_name = getattr(cls, '__module__', None)
 
     # This return true only if this name is that of the "builtins" module
     # declaring all builtin types.
@@ -20,14 +20,39 @@ from beartype._data.hint.datahinttyping import (
     LexicalScope,
     TypeException,
 )
+from beartype._util.cache.map.utilmaplru import CacheLruStrong
 from beartype._util.text.utiltextlabel import label_exception
 from beartype._util.text.utiltextmunge import number_str_lines
 from beartype._util.utilobject import get_object_name
 from collections.abc import Callable
 from functools import update_wrapper
+from types import CodeType
 from linecache import cache as linecache_cache  # type: ignore[attr-defined]
 from weakref import finalize
 
+# ....................{ PRIVATE ~ globals                  }....................
+_FUNC_CODE_TO_CODE_COMPILED = CacheLruStrong(size=256)
+'''
+**Compiled code cache** (i.e., LRU cache mapping from the code snippet defining
+each function previously created by the :func:`.make_func` factory to the code
+object compiled from that snippet).
+
+Compiling a code snippet is the single most expensive step of creating a
+function from that snippet -- dominating even the code generation preceding
+that compilation. Since code generated by :mod:`beartype` is memoized and thus
+highly repetitive (e.g., wrappers type-checking callables sharing the same
+signature and type hints), this cache avoids recompiling identical code.
+
+Note that this cache strongly retains the full source of up to 256 code
+snippets as keys *and* the code objects compiled from those snippets as values
+for the lifetime of the active Python process. Each lookup also hashes the full
+source of the passed snippet, as that snippet is typically a newly generated
+string whose hash has yet to be cached. Both costs are negligible compared to
+compilation: generated snippets rarely exceed a few kilobytes, bounding this
+cache to at most a few megabytes, while hashing a string is linear in its
+length and thus no more expensive than hashing that string into a digest.
+'''
+
 # ....................{ MAKERS                             }....................
 def make_func(
     # Mandatory arguments.
@@ -226,6 +251,20 @@ def make_func(
     # ..................{ CREATION                           }..................
     # Attempt to...
     try:
+        # Code object previously compiled from this snippet if any *OR* "None"
+        # otherwise.
+        #
+        # Note that this cache is intentionally bypassed when debugging this
+        # function, guaranteeing the "linecache" entry cached below to be
+        # associated with a code object compiled for this function.
+        func_code_compiled = (
+            None
+            if is_debug else
+            _FUNC_CODE_TO_CODE_COMPILED.get(func_code)
+        )
+
+        # If this snippet has yet to be compiled, compile this snippet.
+        #
         # Call the more verbose and obfuscatory compile() builtin instead of
         # simply calling "exec(func_code, func_globals, func_locals)". Why?
         # Because the exec() builtin does *NOT* provide a means to set this
@@ -235,7 +274,13 @@ def make_func(
         # willing to constrain the passed "func_code" to a single statement. In
         # casual testing, there is very little performance difference between
         # the two (with an imperceptibly slight edge going to "single").
-        func_code_compiled = compile(func_code, func_filename, 'exec')
+        if func_code_compiled is None:
+            func_code_compiled = compile(func_code, func_filename, 'exec')
+
+            # If *NOT* debugging this function, cache this code object.
+            if not is_debug:
+                _FUNC_CODE_TO_CODE_COMPILED[func_code] = func_code_compiled
+        # Else, this snippet was previously compiled.
         assert func_name not in func_locals
 
         # Define that function. For obscure and likely uninteresting reasons,
@@ -282,6 +327,15 @@ def make_func(
         )
     # Else, that function is callable.
 
+    # If the code object underlying that function was compiled for a different
+    # function defined by the same code snippet, uniquify the fake filename
+    # embedded in that code object *AND* all code objects nested in that code
+    # object (e.g., of generator expressions) against this function.
+    if func.__code__.co_filename != func_filename:  # type: ignore[attr-defined]
+        func.__code__ = _replace_code_filename(  # type: ignore[attr-defined]
+            func.__code__, func_filename)  # type: ignore[attr-defined]
+    # Else, that code object was compiled for this function.
+
     # If that function is a wrapper wrapping a wrappee callable, propagate
     # dunder attributes from that wrappee onto this wrapper.
     if func_wrapped is not None:
@@ -336,6 +390,42 @@ def make_func(
     # Return that function.
     return func
 
+# ....................{ PRIVATE ~ replacers                }....................
+def _replace_code_filename(code: CodeType, filename: str) -> CodeType:
+    '''
+    Shallow copy of the passed code object whose fake filename *and* the fake
+    filenames of all code objects transitively nested in that code object
+    (e.g., of generator expressions, lambdas, and nested functions) are
+    replaced by the passed filename.
+
+    Parameters
+    ----------
+    code : CodeType
+        Code object to be copied.
+    filename : str
+        Fake filename to be embedded in this copy.
+
+    Returns
+    ----------
+    CodeType
+        Copy of this code object embedding this filename.
+    '''
+    assert isinstance(code, CodeType), f'{repr(code)} not code object.'
+    assert isinstance(filename, str), f'{repr(filename)} not string.'
+
+    # Tuple of all constants of this code object, replacing each nested code
+    # object with a copy embedding this filename.
+    code_consts = tuple(
+        _replace_code_filename(code_const, filename)
+        if isinstance(code_const, CodeType) else
+        code_const
+        for code_const in code.co_consts
+    )
+
+    # Return a copy of this code object embedding this filename and these
+    # constants.
+    return code.replace(co_filename=filename, co_consts=code_consts)
+
 # ....................{ COPIERS                            }....................
 #FIXME: Consider excising. Although awesome, this is no longer needed.
 # from beartype._util.func.utilfunctest import die_unless_func_python
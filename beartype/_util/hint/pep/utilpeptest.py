@@ -23,7 +23,9 @@ from beartype._data.hint.datahinttyping import TypeException
 from beartype._data.hint.pep.datapeprepr import (
     HINTS_PEP484_REPR_PREFIX_DEPRECATED)
 from beartype._data.hint.pep.sign.datapepsignset import (
+    HINT_SIGNS_ORIGIN_ISINSTANCEABLE,
     HINT_SIGNS_SUPPORTED,
+    HINT_SIGNS_SUPPORTED_DEEP,
     HINT_SIGNS_TYPE_MIMIC,
 )
 from beartype._data.module.datamodtyping import TYPING_MODULE_NAMES
@@ -792,6 +794,53 @@ def is_hint_pep_args(hint: object) -> bool:
     # Return true only if this hint is subscripted by one or more arguments.
     return bool(get_hint_pep_args(hint))
 
+# ....................{ TESTERS ~ shallow                  }....................
+def is_hint_pep_shallow(hint: object, hint_sign: object) -> bool:
+    '''
+    :data:`True` only if the passed PEP-compliant type hint identified by the
+    passed sign is **shallowly type-checkable** (i.e., type-checkable by a
+    single :func:`isinstance` call against the origin type originating this
+    hint, such as :class:`list` for the hint ``typing.List``).
+
+    This tester returns :data:`True` only if this hint both:
+
+    * Originates from an origin type and may thus be shallowly type-checked
+      against that type *and* is either:
+
+      * Unsubscripted *or*...
+      * Currently unsupported with deep type-checking.
+
+    This tester is intentionally *not* memoized (e.g., by the
+    :func:`.callable_cached` decorator), as the implementation trivially reduces
+    to an efficient one-liner.
+
+    Parameters
+    ----------
+    hint : object
+        PEP-compliant type hint to be inspected.
+    hint_sign : HintSign
+        Sign uniquely identifying this hint, passed to avoid recomputing this
+        sign when the caller has already done so.
+
+    Returns
+    -------
+    bool
+        :data:`True` only if this hint is shallowly type-checkable.
+    '''
+
+    # Return true only if this hint both...
+    return (
+        # Originates from an origin type and may thus be shallowly type-checked
+        # against that type *AND is either...
+        hint_sign in HINT_SIGNS_ORIGIN_ISINSTANCEABLE and (
+            # Unsubscripted *OR*...
+            not is_hint_pep_args(hint) or
+            #FIXME: Remove this branch *AFTER* deeply supporting all hints.
+            # Currently unsupported with deep type-checking.
+            hint_sign not in HINT_SIGNS_SUPPORTED_DEEP
+        )
+    )
+
 # ....................{ TESTERS ~ typevars                 }....................
 #FIXME: Overkill. Replace directly with a simple test, please.
 #
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2023 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide **string formatting utilities** (i.e., callables and classes
+precompiling :meth:`str.format`-style templates into efficiently reusable
+objects).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype.roar._roarexc import _BeartypeUtilTextException
+from beartype.typing import (
+    List,
+    Optional,
+    Tuple,
+)
+from string import Formatter
+
+# ....................{ CLASSES                            }....................
+class FormatPlan(object):
+    '''
+    **Format plan** (i.e., :meth:`str.format`-style template precompiled at
+    import time into a list of literal substrings interleaved with the names
+    of the replacement fields to be interpolated between those substrings).
+
+    The :meth:`str.format` method reparses the brace grammar of its template
+    *and* packs all passed keyword arguments into a new dictionary on each
+    call. Code generators repeatedly formatting the same templates (e.g., the
+    :mod:`beartype._check.code.codemake` submodule) thus spend most of their
+    time reparsing templates whose structure is known at import time. Format
+    plans parse each template exactly once, reducing each subsequent
+    formatting to a list copy, one dictionary lookup per replacement field,
+    and a single :meth:`str.join`.
+
+    Caveats
+    ----------
+    **Format plans only support bare replacement fields** (e.g.,
+    ``{indent_curr}``). Replacement fields with conversions (e.g.,
+    ``{arg_name!r}``) or format specifications (e.g., ``{arg_index:d}``) are
+    rejected at compilation time with an exception.
+
+    **Format plans do not stringify the values of replacement fields.** Callers
+    are required to pass only strings (e.g., by manually calling :func:`str`
+    on integers beforehand). Since the values of replacement fields are
+    almost always Python code snippets that are already strings, this
+    trivially avoids a redundant :func:`str` call per replacement field.
+
+    Attributes
+    ----------
+    _chunks : List[Optional[str]]
+        List of all substrings to be joined together when formatting this
+        plan, such that:
+
+        * Each item with an even index is a literal substring of the template
+          compiled by this plan with all escaped braces (i.e., ``{{`` and
+          ``}}``) unescaped.
+        * Each item with an odd index is :data:`None`, placeholding the value
+          of the replacement field to be subsequently interpolated there.
+    _field_indices : Tuple[Tuple[int, str], ...]
+        Tuple of 2-tuples ``(chunk_index, field_name)`` describing each
+        replacement field of the template compiled by this plan, where:
+
+        * ``chunk_index`` is the 0-based index of the item of the
+          :attr:`_chunks` list to be replaced by the value of that field.
+        * ``field_name`` is the name of that field.
+    template : str
+        Original :meth:`str.format`-style template compiled by this plan.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables across frequently called
+    # methods. Slotting has been shown to reduce read and write costs by
+    # approximately ~10%, which is non-trivial.
+    __slots__ = (
+        '_chunks',
+        '_field_indices',
+        'template',
+    )
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(self, template: str) -> None:
+        '''
+        Initialize this format plan by compiling the passed template.
+
+        Parameters
+        ----------
+        template : str
+            :meth:`str.format`-style template to be compiled.
+
+        Raises
+        ----------
+        _BeartypeUtilTextException
+            If this template contains one or more replacement fields that are
+            either anonymous (e.g., ``{}``), converted (e.g., ``{muh_str!r}``),
+            *or* format-specified (e.g., ``{muh_int:d}``).
+        '''
+        assert isinstance(template, str), f'{repr(template)} not string.'
+
+        # List of all substrings to be joined together, initialized to the
+        # empty literal substring preceding the first replacement field.
+        chunks: List[Optional[str]] = ['']
+
+        # List of all 2-tuples "(chunk_index, field_name)".
+        field_indices: List[Tuple[int, str]] = []
+
+        # For each literal substring and replacement field parsed from this
+        # template by the public Formatter.parse() method, which wraps the same
+        # parser underlying the str.format() method...
+        #
+        # Note that this parser yields escaped braces as literal substrings
+        # *WITHOUT* accompanying replacement fields (e.g., "{{" as the literal
+        # substring "{" and the field name "None"). Ergo, consecutive literal
+        # substrings are merged into the same chunk below.
+        for literal, field_name, field_spec, field_conversion in (
+            Formatter().parse(template)):
+            # Append this literal substring to the current literal chunk.
+            chunks[-1] += literal  # type: ignore[operator]
+
+            # If this literal substring is *NOT* followed by a replacement
+            # field, continue to the next literal substring.
+            if field_name is None:
+                continue
+            # Else, this literal substring is followed by a replacement field.
+            #
+            # If this field is unsupported, raise an exception.
+            elif not field_name or field_spec or field_conversion:
+                raise _BeartypeUtilTextException(
+                    f'Format template {repr(template)} replacement field '
+                    f'"{{{field_name}}}" unsupported (i.e., either anonymous, '
+                    f'converted, or format-specified).'
+                )
+            # Else, this field is supported.
+
+            # Record this field to be interpolated at the next chunk index.
+            field_indices.append((len(chunks), field_name))
+
+            # Append a placeholder for the value of this field followed by a
+            # new empty literal chunk.
+            chunks.append(None)
+            chunks.append('')
+
+        # Classify all remaining instance variables.
+        self._chunks = chunks
+        self._field_indices = tuple(field_indices)
+        self.template = template
+
+    # ..................{ DUNDERS                            }..................
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({repr(self.template)})'
+
+    # ..................{ FORMATTERS                         }..................
+    def format(self, **kwargs: str) -> str:
+        '''
+        String formatted from the template compiled by this plan by replacing
+        each replacement field in that template with the value of the passed
+        keyword argument of the same name.
+
+        This method is intentionally named after (and thus a drop-in
+        replacement of) the :meth:`str.format` method, enabling callers to
+        transparently localize bound methods of either.
+
+        Parameters
+        ----------
+        kwargs : str
+            Keyword arguments mapping from the name of each replacement field
+            in this template to the string value of that field.
+
+        Returns
+        ----------
+        str
+            String formatted from this template.
+
+        Raises
+        ----------
+        KeyError
+            If one or more replacement fields in this template are unpassed.
+        TypeError
+            If one or more passed values of these fields are *not* strings.
+        '''
+
+        # Shallow copy of the list of all substrings to be joined, enabling
+        # placeholders in this copy to be safely replaced in-place below.
+        chunks = self._chunks[:]
+
+        # Replace each placeholder with the value of the corresponding field.
+        for chunk_index, field_name in self._field_indices:
+            chunks[chunk_index] = kwargs[field_name]
+
+        # Return the concatenation of these substrings.
+        return ''.join(chunks)  # type: ignore[arg-type]
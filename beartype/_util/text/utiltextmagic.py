@@ -28,17 +28,26 @@ PEP-agnostic code snippet expanding to three levels of indentation.
 '''
 
 # ....................{ CODE ~ operator                    }....................
-LINE_RSTRIP_INDEX_AND = -len(' and')
+CODE_OPERATOR_AND = ' and'
 '''
-Negative index relative to the end of any arbitrary newline-delimited Python
-code string suffixed by the boolean operator ``" and"`` required to strip that
-suffix from that substring.
+PEP-agnostic code snippet delimiting consecutive newline-prefixed Python
+expressions to be conjunctively combined by the boolean operator ``and``.
+
+Callers are expected to join lists of such expressions with the
+:meth:`str.join` method of this snippet, which (unlike the alternative of
+suffixing each expression by this operator and then slicing the trailing
+operator off the concatenation of those expressions) avoids copying that
+concatenation.
 '''
 
 
-LINE_RSTRIP_INDEX_OR = -len(' or')
+CODE_OPERATOR_OR = ' or'
 '''
-Negative index relative to the end of any arbitrary newline-delimited Python
-code string suffixed by the boolean operator ``" or"`` required to strip that
-suffix from that substring.
+PEP-agnostic code snippet delimiting consecutive newline-prefixed Python
+expressions to be disjunctively combined by the boolean operator ``or``.
+
+See Also
+----------
+:data:`.CODE_OPERATOR_AND`
+    Further details.
 '''
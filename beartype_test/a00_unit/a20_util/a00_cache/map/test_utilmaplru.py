@@ -121,6 +121,20 @@ def test_lrucachestrong_two_pass() -> None:
     assert next(lru_cache_items) == LRU_CACHE_ITEM_C
     assert next(lru_cache_items) == LRU_CACHE_ITEM_B
 
+    # Confirm get() resets a cached key.
+    assert lru_cache.get(LRU_CACHE_KEY_C) == LRU_CACHE_VALUE_C
+    lru_cache_items = iter(lru_cache.items())
+    assert next(lru_cache_items) == LRU_CACHE_ITEM_B
+    assert next(lru_cache_items) == LRU_CACHE_ITEM_C
+
+    # Confirm get() returns the passed default for an uncached key *WITHOUT*
+    # modifying the cache.
+    assert lru_cache.get(LRU_CACHE_KEY_A) is None
+    assert lru_cache.get(LRU_CACHE_KEY_A, LRU_CACHE_VALUE_A) == (
+        LRU_CACHE_VALUE_A)
+    assert len(lru_cache) == 2
+    assert LRU_CACHE_KEY_A not in lru_cache
+
 
 def test_lrucachestrong_fail() -> None:
     """
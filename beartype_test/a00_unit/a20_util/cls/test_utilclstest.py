@@ -79,12 +79,21 @@ def test_is_type_builtin() -> None:
     '''
 
     # Defer test-specific imports.
+    from beartype._data.cls.datacls import (
+        TYPES_BUILTIN as TYPES_BUILTIN_RUNTIME)
     from beartype._util.cls.utilclstest import is_type_builtin
     from beartype_test.a00_unit.data.data_type import (
         TYPES_BUILTIN,
+        TYPES_BUILTIN_FAKE,
         TYPES_NONBUILTIN,
+        UnhashableClass,
     )
 
+    # Assert the runtime set of real builtin types short-circuiting this tester
+    # contains all builtin types *AND* no fake builtin types.
+    assert TYPES_BUILTIN <= TYPES_BUILTIN_RUNTIME
+    assert not (TYPES_BUILTIN_RUNTIME & TYPES_BUILTIN_FAKE)
+
     # Assert this tester accepts all builtin types.
     for type_builtin in TYPES_BUILTIN:
         assert is_type_builtin(type_builtin) is True
@@ -93,6 +102,9 @@ def test_is_type_builtin() -> None:
     for type_nonbuiltin in TYPES_NONBUILTIN:
         assert is_type_builtin(type_nonbuiltin) is False
 
+    # Assert this tester rejects an unhashable non-builtin type.
+    assert is_type_builtin(UnhashableClass) is False
+
 
 def test_is_type_builtin_or_fake() -> None:
     '''
@@ -106,6 +118,7 @@ def test_is_type_builtin_or_fake() -> None:
         TYPES_BUILTIN,
         TYPES_BUILTIN_FAKE,
         Class,
+        UnhashableClass,
     )
 
     # Assert this tester accepts all non-fake builtin types.
@@ -118,3 +131,6 @@ def test_is_type_builtin_or_fake() -> None:
 
     # Assert this tester rejects an arbitrary non-builtin type.
     assert is_type_builtin_or_fake(Class) is False
+
+    # Assert this tester rejects an unhashable non-builtin type.
+    assert is_type_builtin_or_fake(UnhashableClass) is False
@@ -124,6 +124,7 @@ def test_make_func_pass(capsys) -> None:
     from beartype._util.func.utilfuncmake import make_func
     from beartype.typing import Optional
     from linecache import cache as linecache_cache
+    from types import CodeType
 
     # Arbitrary local referenced in functions created below.
     THO_MUCH_IS_TAKEN = 'much abides; and tho’'
@@ -136,23 +137,34 @@ def test_make_func_pass(capsys) -> None:
 
         return 'Moved earth and heaven, that which we are, we are;'
 
-    # Arbitrary wrapper accessing both globally and locally scoped attributes,
-    # exercising most optional parameters.
-    ulysses = make_func(
-        func_name='it_may_be_that_the_gulfs_will_wash_us_down',
-        func_code='''
+    # Arbitrary callable wrapped by another wrapper created below.
+    def that_which_we_are_we_are() -> str:
+        '''
+        Made weak by time and fate, but strong in will
+        '''
+
+        return 'To strive, to seek, to find, and not to yield.'
+
+    # Code snippet declaring wrappers created below.
+    ULYSSES_CODE = '''
 def it_may_be_that_the_gulfs_will_wash_us_down(
     it_may_be_we_shall_touch_the_happy_isles: Optional[str]) -> str:
     return (
         AND_SEE_THE_GREAT_ACHILLES +
-        THO_MUCH_IS_TAKEN +
+        ''.join(much for much in THO_MUCH_IS_TAKEN) +
         we_are_not_now_that_strength_which_in_old_days() +
         (
             it_may_be_we_shall_touch_the_happy_isles or
             'Made weak by time and fate, but strong in will'
         )
     )
-''',
+'''
+
+    # Arbitrary wrapper accessing both globally and locally scoped attributes,
+    # exercising most optional parameters.
+    ulysses = make_func(
+        func_name='it_may_be_that_the_gulfs_will_wash_us_down',
+        func_code=ULYSSES_CODE,
         func_globals={
             'AND_SEE_THE_GREAT_ACHILLES': AND_SEE_THE_GREAT_ACHILLES,
             'THO_MUCH_IS_TAKEN': THO_MUCH_IS_TAKEN,
@@ -173,6 +185,42 @@ def it_may_be_that_the_gulfs_will_wash_us_down(
     odyssey = ulysses('Made weak by time and fate, but strong in will')
     assert 'Made weak by time and fate, but strong in will' in odyssey
 
+    # Arbitrary wrapper declared by the same code snippet as the prior wrapper
+    # but accessing different globally scoped attributes and wrapping a
+    # different wrappee.
+    telemachus = make_func(
+        func_name='it_may_be_that_the_gulfs_will_wash_us_down',
+        func_code=ULYSSES_CODE,
+        func_globals={
+            'AND_SEE_THE_GREAT_ACHILLES': AND_SEE_THE_GREAT_ACHILLES,
+            'THO_MUCH_IS_TAKEN': THO_MUCH_IS_TAKEN,
+            'we_are_not_now_that_strength_which_in_old_days': (
+                that_which_we_are_we_are),
+        },
+        func_locals={
+            'Optional': Optional,
+        },
+        func_wrapped=that_which_we_are_we_are,
+    )
+
+    # Assert this wrapper returns an expected value specific to this wrapper.
+    odyssey = telemachus(None)
+    assert 'To strive, to seek, to find, and not to yield.' in odyssey
+
+    # Assert these wrappers share the same bytecode but are associated with
+    # different fake filenames uniquely synthesized for each wrapper.
+    assert telemachus.__code__.co_code == ulysses.__code__.co_code
+    assert telemachus.__code__.co_filename != ulysses.__code__.co_filename
+
+    # Assert the code objects nested in these wrappers (e.g., of generator
+    # expressions) are associated with the same fake filenames as these
+    # wrappers.
+    for odysseus in (ulysses, telemachus):
+        for odysseus_const in odysseus.__code__.co_consts:
+            if isinstance(odysseus_const, CodeType):
+                assert odysseus_const.co_filename == (
+                    odysseus.__code__.co_filename)
+
     # Arbitrary debuggable callable accessing no scoped attributes.
     to_strive_to_seek_to_find = make_func(
         func_name='to_strive_to_seek_to_find',
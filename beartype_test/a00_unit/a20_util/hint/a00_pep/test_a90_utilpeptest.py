@@ -172,6 +172,35 @@ def test_is_hint_pep_args(hints_pep_meta) -> None:
         assert is_hint_pep_args(not_hint_pep) is False
 
 
+def test_is_hint_pep_shallow() -> None:
+    '''
+    Test the
+    :func:`beartype._util.hint.pep.utilpeptest.is_hint_pep_shallow`
+    tester.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.hint.pep.utilpepget import get_hint_pep_sign
+    from beartype._util.hint.pep.utilpeptest import is_hint_pep_shallow
+    from typing import (
+        Callable,
+        Hashable,
+        List,
+        Union,
+    )
+
+    # Assert this tester accepts unsubscripted originative hints and
+    # subscripted originative hints currently unsupported with deep
+    # type-checking.
+    for hint in (Callable[[int], str], Hashable, List,):
+        assert is_hint_pep_shallow(hint, get_hint_pep_sign(hint)) is True
+
+    # Assert this tester rejects subscripted originative hints supported with
+    # deep type-checking *AND* non-originative hints.
+    for hint in (List[int], Union[int, str],):
+        assert is_hint_pep_shallow(hint, get_hint_pep_sign(hint)) is False
+
+
 #FIXME: Implement us up, please.
 # def test_is_hint_pep_uncached() -> None:
 #     '''
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2023 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide **string formatting** utility unit tests.
+
+This submodule unit tests the public API of the private
+:mod:`beartype._util.text.utiltextformat` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+# !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+# !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                              }....................
+def test_format_plan() -> None:
+    '''
+    Test the :class:`beartype._util.text.utiltextformat.FormatPlan` class.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype.roar._roarexc import _BeartypeUtilTextException
+    from beartype._util.text.utiltextformat import FormatPlan
+    from pytest import raises
+
+    # ....................{ LOCALS                         }....................
+    # Template containing repeated, escaped, and adjacent replacement fields.
+    TEMPLATE = (
+        '{indent}isinstance({pith}, {hint}) and\n'
+        '{{indent}}{indent}{pith}{hint} {{still_escaped}}'
+    )
+
+    # Keyword arguments formatting that template.
+    KWARGS = dict(indent='    ', pith='__beartype_pith_0', hint='int')
+
+    # ....................{ PASS                           }....................
+    # Assert that format plans format templates exactly as str.format() does.
+    assert FormatPlan(TEMPLATE).format(**KWARGS) == TEMPLATE.format(**KWARGS)
+    assert FormatPlan('').format() == ''
+    assert FormatPlan('Brace {{yourself}}.').format() == 'Brace {yourself}.'
+    assert FormatPlan('{bear}').format(bear='Grizzly') == 'Grizzly'
+
+    # Assert that format plans are reusable.
+    format_plan = FormatPlan('{pith} in {hint}')
+    assert format_plan.format(pith='a', hint='b') == 'a in b'
+    assert format_plan.format(pith='c', hint='d') == 'c in d'
+    assert format_plan.template == '{pith} in {hint}'
+
+    # ....................{ FAIL                           }....................
+    # Assert that compiling templates containing unsupported replacement
+    # fields raises the expected exception.
+    with raises(_BeartypeUtilTextException):
+        FormatPlan('{}')
+    with raises(_BeartypeUtilTextException):
+        FormatPlan('{arg_name!r}')
+    with raises(_BeartypeUtilTextException):
+        FormatPlan('{arg_index:d}')
+
+    # Assert that formatting with missing replacement fields raises the
+    # expected exception.
+    with raises(KeyError):
+        format_plan.format(pith='e')
@@ -151,6 +151,7 @@ def test_decor_arg_kind_kwonly_mixed() -> None:
     from beartype.roar import BeartypeCallHintViolation
     from beartype.typing import Union
     from beartype_test._util.pytroar import raises_uncached
+    from pytest import raises
 
     # Decorated callable to be exercised.
     @beartype
@@ -173,6 +174,13 @@ def test_decor_arg_kind_kwonly_mixed() -> None:
         my_own_special_plan(
             if_this_creature=b'dead would ever approach his vision')
 
+    # Assert that calling this callable without its mandatory keyword-only
+    # parameter raises the exception raised by the Python interpreter on
+    # calling the decorated callable rather than a type-checking violation.
+    with raises(TypeError) as exception:
+        my_own_special_plan(i_listened_to_these_words='I listened to these')
+    assert not isinstance(exception.value, BeartypeCallHintViolation)
+
 
 def test_decor_arg_kind_flex_varpos_kwonly() -> None:
     '''
@@ -53,6 +53,59 @@ class MasterlessDecreeVenomlessWhich(Enum):
     NOMENCLATURE_WEATHER_VANES_OF = 0
     NOMINALLY_UNSWAIN_AUTODIDACTIC_IDIOCRACY_LESS_A = 1
 
+
+class UnhashableInvectiveElected(Enum):
+    '''
+    Arbitrary enumeration whose members are unhashable, typically when
+    subscripting the :pep:`586`-compliant :attr:`typing.Literal` type hint
+    factory.
+
+    Overriding the ``__eq__()`` dunder method *without* also overriding the
+    ``__hash__()`` dunder method implicitly nullifies the latter, rendering all
+    members of this enumeration unhashable.
+    '''
+
+    THANKLESSLY_CLASSED_NOMINAL = 0
+    WORTHILY_UNTRUST = 1
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+# ....................{ CLASSES ~ hash                     }....................
+class UnhashableInt(int):
+    '''
+    Arbitrary integer subclass whose instances are unhashable, typically when
+    type-checked against the :pep:`586`-compliant :attr:`typing.Literal` type
+    hint factory subscripted by hashable integers.
+
+    Overriding the ``__eq__()`` dunder method *without* also overriding the
+    ``__hash__()`` dunder method implicitly nullifies the latter, rendering all
+    instances of this subclass unhashable despite comparing equal to integers.
+    '''
+
+    def __eq__(self, other: object) -> bool:
+        return int.__eq__(self, other)
+
+
+class UnhashableMetaclass(type):
+    '''
+    Arbitrary metaclass whose classes are unhashable.
+
+    Nullifying the ``__hash__()`` dunder method of a metaclass renders all
+    classes declared with that metaclass unhashable, preventing those classes
+    from being added to sets or used as dictionary keys.
+    '''
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class UnhashableClass(metaclass=UnhashableMetaclass):
+    '''
+    Arbitrary pure-Python class whose metaclass renders this class unhashable.
+    '''
+
+    pass
+
 # ....................{ CLASSES ~ hierarchy : 1            }....................
 # Arbitrary class hierarchy.
 
@@ -26,7 +26,10 @@ def hints_pep_meta_pep586() -> 'List[HintPepMetadata]':
     )
     from beartype._util.module.lib.utiltyping import get_typing_attrs
     from beartype_test.a00_unit.data.data_type import (
-        MasterlessDecreeVenomlessWhich)
+        MasterlessDecreeVenomlessWhich,
+        UnhashableInt,
+        UnhashableInvectiveElected,
+    )
     from beartype_test.a00_unit.data.hint.util.data_hintmetacls import (
         HintPepMetadata,
         HintPithSatisfiedMetadata,
@@ -109,6 +112,9 @@ def hints_pep_meta_pep586() -> 'List[HintPepMetadata]':
                     # Integer constant defined by different syntax but
                     # semantically equal to the same integer.
                     HintPithSatisfiedMetadata(42),
+                    # Unhashable integer semantically equal to the same
+                    # integer.
+                    HintPithSatisfiedMetadata(UnhashableInt(42)),
                     # Integer constant *NOT* equal to the same integer.
                     HintPithUnsatisfiedMetadata(
                         pith=41,
@@ -117,6 +123,14 @@ def hints_pep_meta_pep586() -> 'List[HintPepMetadata]':
                         # literal.
                         exception_str_match_regexes=(r'\b42\b',),
                     ),
+                    # Unhashable integer *NOT* equal to the same integer.
+                    HintPithUnsatisfiedMetadata(
+                        pith=UnhashableInt(41),
+                        # Match that the exception message raised for this
+                        # object embeds the representation of the expected
+                        # literal.
+                        exception_str_match_regexes=(r'\b42\b',),
+                    ),
                     # Floating-point constant semantically equal to the same
                     # integer but of a differing type.
                     HintPithUnsatisfiedMetadata(
@@ -245,6 +259,28 @@ def hints_pep_meta_pep586() -> 'List[HintPepMetadata]':
                 ),
             ),
 
+            # Literal unhashable enumeration member.
+            HintPepMetadata(
+                hint=Literal[
+                    UnhashableInvectiveElected.THANKLESSLY_CLASSED_NOMINAL],
+                pep_sign=HintSignLiteral,
+                is_args=True,
+                piths_meta=(
+                    # Enumeration member accessed by the same syntax.
+                    HintPithSatisfiedMetadata(
+                        UnhashableInvectiveElected.THANKLESSLY_CLASSED_NOMINAL),
+                    # Enumeration member *NOT* equal to the same member.
+                    HintPithUnsatisfiedMetadata(
+                        pith=UnhashableInvectiveElected.WORTHILY_UNTRUST,
+                        # Match that the exception message raised for this
+                        # object embeds the representation of the expected
+                        # literal.
+                        exception_str_match_regexes=(
+                            r'\bTHANKLESSLY_CLASSED_NOMINAL\b',),
+                    ),
+                ),
+            ),
+
             # ..............{ LITERALS ~ nested                  }..............
             # List of literal arbitrary Unicode strings.
             HintPepMetadata(
@@ -1609,6 +1609,72 @@ def hints_pep_meta_pep484() -> 'List[HintPepMetadata]':
             is_typevars=True,
         ),
 
+        # Union of one non-"typing" type and one unsubscripted originative
+        # "typing" type, exercising an edge case in which the latter is
+        # shallowly type-checked by the same isinstance() call type-checking
+        # the former.
+        HintPepMetadata(
+            hint=Union[int, Hashable],
+            pep_sign=HintSignUnion,
+            typehint_cls=UnionTypeHint,
+            piths_meta=(
+                # Integer constant.
+                HintPithSatisfiedMetadata(0xDEADBEEF),
+                # String constant, which is hashable.
+                HintPithSatisfiedMetadata(
+                    'Hashed into heaps of hallowed, hollowed ash'),
+                # List, which is unhashable.
+                HintPithUnsatisfiedMetadata(
+                    pith=['Unhashed, unhallowed, and unhollowed', 'still',],
+                    # Match that the exception message raised for this object
+                    # declares the types *NOT* satisfied by this object.
+                    exception_str_match_regexes=(
+                        r'\bHashable\b',
+                        r'\bint\b',
+                    ),
+                    # Match that the exception message raised for this object
+                    # does *NOT* contain a newline or bullet delimiter.
+                    exception_str_not_match_regexes=(
+                        r'\n',
+                        r'\*',
+                    ),
+                ),
+            ),
+        ),
+
+        # Union of one non-"typing" type and one subscripted originative
+        # "typing" type that is currently unsupported with deep type-checking,
+        # exercising an edge case in which the latter is shallowly
+        # type-checked by the same isinstance() call type-checking the former.
+        HintPepMetadata(
+            hint=Union[str, Callable[[int], str]],
+            pep_sign=HintSignUnion,
+            typehint_cls=UnionTypeHint,
+            piths_meta=(
+                # String constant.
+                HintPithSatisfiedMetadata(
+                    'Calling unto callables uncalled for'),
+                # Arbitrary callable.
+                HintPithSatisfiedMetadata(str),
+                # Integer constant.
+                HintPithUnsatisfiedMetadata(
+                    pith=0xFEEDFACE,
+                    # Match that the exception message raised for this object
+                    # declares the types *NOT* satisfied by this object.
+                    exception_str_match_regexes=(
+                        r'\bCallable\b',
+                        r'\bstr\b',
+                    ),
+                    # Match that the exception message raised for this object
+                    # does *NOT* contain a newline or bullet delimiter.
+                    exception_str_not_match_regexes=(
+                        r'\n',
+                        r'\*',
+                    ),
+                ),
+            ),
+        ),
+
         # ................{ UNION ~ nested                     }................
         # Nested unions exercising edge cases induced by Python >= 3.8
         # optimizations leveraging PEP 572-style assignment expressions.